@@ -0,0 +1,49 @@
+"""Unique translation per language_code and key
+
+Revision ID: 19b81a4a9254
+Revises: 52c47f226da1
+Create Date: 2026-10-17 11:26:54.630127
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+import importlib
+import warnings
+from app.core.utils.loader import dynamic_import
+
+
+custom_models = dynamic_import("custom/models", "custom.models")
+
+
+for model_name, module in custom_models.items():
+    try:
+        importlib.import_module(f"custom.models.{model_name}")
+    except Exception as e:
+        warnings.warn(f"Could not load custom model `{model_name}`: {e}")
+
+
+revision = '19b81a4a9254'
+down_revision = '52c47f226da1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The seed data contains duplicate keys: keep the row stored last in the
+    # table (highest ctid). That is not necessarily the last one written, since
+    # updated rows may be stored in free space earlier in the table.
+    op.execute("""
+        DELETE FROM translation older
+        USING translation newer
+        WHERE older.language_code = newer.language_code
+          AND older.key = newer.key
+          AND older.ctid < newer.ctid
+    """)
+    op.create_unique_constraint('uq_translation_language_code_key', 'translation', ['language_code', 'key'])
+
+
+def downgrade():
+    op.drop_constraint('uq_translation_language_code_key', 'translation', type_='unique')
@@ -0,0 +1,56 @@
+"""Store refresh token digests under a unique index
+
+Revision ID: 26f9ef39e02b
+Revises: 833986c43ddd
+Create Date: 2026-10-17 09:12:41.508113
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+import importlib
+import warnings
+from app.core.utils.loader import dynamic_import
+
+
+custom_models = dynamic_import("custom/models", "custom.models")
+
+
+for model_name, module in custom_models.items():
+    try:
+        importlib.import_module(f"custom.models.{model_name}")
+    except Exception as e:
+        warnings.warn(f"Could not load custom model `{model_name}`: {e}")
+
+
+revision = '26f9ef39e02b'
+down_revision = '833986c43ddd'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('refreshtoken', sa.Column('token_hash', sqlmodel.sql.sqltypes.AutoString(length=64), nullable=True))
+
+    # Keep only the newest row of identical tokens, then backfill the digests
+    op.execute("""
+        DELETE FROM refreshtoken older
+        USING refreshtoken newer
+        WHERE older.token = newer.token
+          AND (older.created_at, older.id) < (newer.created_at, newer.id)
+    """)
+    op.execute("UPDATE refreshtoken SET token_hash = encode(sha256(convert_to(token, 'UTF8')), 'hex')")
+
+    op.alter_column('refreshtoken', 'token_hash', nullable=False)
+    op.create_index(op.f('ix_refreshtoken_token_hash'), 'refreshtoken', ['token_hash'], unique=True)
+    op.drop_column('refreshtoken', 'token')
+
+
+def downgrade():
+    # Digests cannot be turned back into tokens: existing sessions are dropped
+    op.execute("DELETE FROM refreshtoken")
+    op.add_column('refreshtoken', sa.Column('token', sa.String(length=500), nullable=False))
+    op.drop_index(op.f('ix_refreshtoken_token_hash'), table_name='refreshtoken')
+    op.drop_column('refreshtoken', 'token_hash')
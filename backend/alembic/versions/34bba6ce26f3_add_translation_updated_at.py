@@ -0,0 +1,41 @@
+"""Add updated_at to translation
+
+Revision ID: 34bba6ce26f3
+Revises: 19b81a4a9254
+Create Date: 2026-10-17 13:02:41.318540
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+import importlib
+import warnings
+from app.core.utils.loader import dynamic_import
+
+
+custom_models = dynamic_import("custom/models", "custom.models")
+
+
+for model_name, module in custom_models.items():
+    try:
+        importlib.import_module(f"custom.models.{model_name}")
+    except Exception as e:
+        warnings.warn(f"Could not load custom model `{model_name}`: {e}")
+
+
+revision = '34bba6ce26f3'
+down_revision = '19b81a4a9254'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('translation', sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False))
+    op.create_index(op.f('ix_translation_updated_at'), 'translation', ['updated_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_translation_updated_at'), table_name='translation')
+    op.drop_column('translation', 'updated_at')
@@ -0,0 +1,43 @@
+"""Trigram indexes for translation search
+
+Revision ID: 3ba0ee4257f1
+Revises: 5fd949f57b1e
+Create Date: 2026-10-17 17:02:44.351207
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+import importlib
+import warnings
+from app.core.utils.loader import dynamic_import
+
+
+custom_models = dynamic_import("custom/models", "custom.models")
+
+
+for model_name, module in custom_models.items():
+    try:
+        importlib.import_module(f"custom.models.{model_name}")
+    except Exception as e:
+        warnings.warn(f"Could not load custom model `{model_name}`: {e}")
+
+
+revision = '3ba0ee4257f1'
+down_revision = '5fd949f57b1e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index('ix_translation_key_trgm', 'translation', ['key'], unique=False, postgresql_using='gin', postgresql_ops={'key': 'gin_trgm_ops'})
+    op.create_index('ix_translation_value_trgm', 'translation', ['value'], unique=False, postgresql_using='gin', postgresql_ops={'value': 'gin_trgm_ops'})
+
+
+def downgrade():
+    op.drop_index('ix_translation_value_trgm', table_name='translation', postgresql_using='gin')
+    op.drop_index('ix_translation_key_trgm', table_name='translation', postgresql_using='gin')
+    # The pg_trgm extension is left installed; other objects may depend on it
@@ -0,0 +1,55 @@
+"""Add translation change history
+
+Revision ID: 4b3387a8f48d
+Revises: 34bba6ce26f3
+Create Date: 2026-10-17 13:48:09.662413
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+import importlib
+import warnings
+from app.core.utils.loader import dynamic_import
+
+
+custom_models = dynamic_import("custom/models", "custom.models")
+
+
+for model_name, module in custom_models.items():
+    try:
+        importlib.import_module(f"custom.models.{model_name}")
+    except Exception as e:
+        warnings.warn(f"Could not load custom model `{model_name}`: {e}")
+
+
+revision = '4b3387a8f48d'
+down_revision = '34bba6ce26f3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('translationchange',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('language_code', sqlmodel.sql.sqltypes.AutoString(length=5), nullable=False),
+    sa.Column('key', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=False),
+    sa.Column('value', sqlmodel.sql.sqltypes.AutoString(length=1000), nullable=True),
+    sa.Column('changed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_translationchange_language_code_id', 'translationchange', ['language_code', 'id'], unique=False)
+    # Start the history from the current catalog, so `since=0` returns it all
+    op.execute("""
+        INSERT INTO translationchange (language_code, key, value, changed_at)
+        SELECT language_code, key, value, updated_at
+        FROM translation
+        ORDER BY updated_at
+    """)
+
+
+def downgrade():
+    op.drop_index('ix_translationchange_language_code_id', table_name='translationchange')
+    op.drop_table('translationchange')
@@ -0,0 +1,48 @@
+"""Enforce one refresh token per user
+
+Revision ID: 52c47f226da1
+Revises: 26f9ef39e02b
+Create Date: 2026-10-17 10:03:18.274905
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+import importlib
+import warnings
+from app.core.utils.loader import dynamic_import
+
+
+custom_models = dynamic_import("custom/models", "custom.models")
+
+
+for model_name, module in custom_models.items():
+    try:
+        importlib.import_module(f"custom.models.{model_name}")
+    except Exception as e:
+        warnings.warn(f"Could not load custom model `{model_name}`: {e}")
+
+
+revision = '52c47f226da1'
+down_revision = '26f9ef39e02b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Keep only the most recent token of each user before enforcing uniqueness
+    op.execute("""
+        DELETE FROM refreshtoken older
+        USING refreshtoken newer
+        WHERE older.user_email = newer.user_email
+          AND (older.created_at, older.id) < (newer.created_at, newer.id)
+    """)
+    op.drop_index(op.f('ix_refreshtoken_user_email'), table_name='refreshtoken')
+    op.create_index(op.f('ix_refreshtoken_user_email'), 'refreshtoken', ['user_email'], unique=True)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_refreshtoken_user_email'), table_name='refreshtoken')
+    op.create_index(op.f('ix_refreshtoken_user_email'), 'refreshtoken', ['user_email'], unique=False)
@@ -0,0 +1,53 @@
+"""Covering unique index on translation language_code and key
+
+Revision ID: 5fd949f57b1e
+Revises: 4b3387a8f48d
+Create Date: 2026-10-17 15:21:37.904518
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+import importlib
+import warnings
+from app.core.utils.loader import dynamic_import
+
+
+custom_models = dynamic_import("custom/models", "custom.models")
+
+
+for model_name, module in custom_models.items():
+    try:
+        importlib.import_module(f"custom.models.{model_name}")
+    except Exception as e:
+        warnings.warn(f"Could not load custom model `{model_name}`: {e}")
+
+
+revision = '5fd949f57b1e'
+down_revision = '4b3387a8f48d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Keep the most recently updated row of any duplicate (language_code, key)
+    op.execute("""
+        DELETE FROM translation older
+        USING translation newer
+        WHERE older.language_code = newer.language_code
+          AND older.key = newer.key
+          AND (older.updated_at, older.ctid) < (newer.updated_at, newer.ctid)
+    """)
+    op.drop_constraint('uq_translation_language_code_key', 'translation', type_='unique')
+    op.drop_index(op.f('ix_translation_language_code'), table_name='translation')
+    op.drop_index(op.f('ix_translation_key'), table_name='translation')
+    op.create_index('ix_translation_language_code_key', 'translation', ['language_code', 'key'], unique=True, postgresql_include=['id'])
+
+
+def downgrade():
+    op.drop_index('ix_translation_language_code_key', table_name='translation')
+    op.create_index(op.f('ix_translation_key'), 'translation', ['key'], unique=False)
+    op.create_index(op.f('ix_translation_language_code'), 'translation', ['language_code'], unique=False)
+    op.create_unique_constraint('uq_translation_language_code_key', 'translation', ['language_code', 'key'])
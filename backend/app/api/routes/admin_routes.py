@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends
 
 from app.core.security.dependencies import SessionDep, get_current_active_superuser
 from app.models import common, user
-from app.services import user_service  # Import user management services
+from app.services import user_service, utils_service
 
 router = APIRouter()
 
@@ -63,3 +63,14 @@ def update_user(session: SessionDep, user_id: UUID, user_in: user.UserUpdate) ->
 def delete_user(session: SessionDep, user_id: UUID) -> common.Message:
     """Delete a user by ID (Admin only)."""
     return user_service.delete_user(session, user_id)
+
+
+@router.get(
+    "/metrics",
+    dependencies=[Depends(get_current_active_superuser)],
+    response_model=dict,
+    operation_id="get_metrics",
+)
+def read_metrics() -> Any:
+    """Retrieve cache and pool counters of the worker serving the request (Admin only)."""
+    return utils_service.collect_metrics()
@@ -14,10 +14,13 @@ from app.core.security.password_security import (
 from app.core.security.refresh_token_service import (
     create_access_token,
     create_refresh_token,
+    create_user_access_token,
     revoke_all_tokens,
     revoke_refresh_token,
+    rotate_refresh_token,
     verify_refresh_token,
 )
+from app.core.security.user_cache import user_cache
 from app.core.utils.email import generate_reset_password_email, send_email
 from app.core.utils.translation_helper import translate
 from app.crud import crud_user
@@ -48,8 +51,8 @@ def login_user(
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     refresh_token_expires = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
 
-    access_token = create_access_token(
-        existing_user.email, expires_delta=access_token_expires
+    access_token = create_user_access_token(
+        existing_user, expires_delta=access_token_expires
     )
     refresh_token = create_refresh_token(
         session, existing_user.email, expires_delta=refresh_token_expires
@@ -65,24 +68,28 @@ def refresh_access_token(
     session: SessionDep, request_data: TokenRefreshRequest, request: Request
 ) -> Token:
     """Verify refresh token and issue a new access token with a new refresh token."""
-    result = verify_refresh_token(session, request_data.refresh_token, request)
-    if not result:
-        raise HTTPException(
-            status_code=401,
-            detail=translate(request, "invalid_or_expired_refresh_token"),
-        )
-
-    email, auth_provider = result
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     refresh_token_expires = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
 
-    new_access_token = create_access_token(
-        email, expires_delta=access_token_expires, auth_provider=auth_provider
-    )
-    new_refresh_token = create_refresh_token(
-        session, email, expires_delta=refresh_token_expires, auth_provider=auth_provider
+    new_refresh_token, email, auth_provider = rotate_refresh_token(
+        session, request_data.refresh_token, refresh_token_expires, request
     )
 
+    # Re-read the user so the new access token carries current claims
+    existing_user = user_cache.get_by_email(email)
+    if existing_user is None:
+        existing_user = crud_user.get_user_by_email(session=session, email=email)
+        if existing_user is not None:
+            user_cache.put(existing_user)
+    if existing_user:
+        new_access_token = create_user_access_token(
+            existing_user, expires_delta=access_token_expires
+        )
+    else:
+        new_access_token = create_access_token(
+            email, expires_delta=access_token_expires, auth_provider=auth_provider
+        )
+
     return Token(
         access_token=new_access_token,
         refresh_token=new_refresh_token,
@@ -206,5 +213,6 @@ def reset_password(
     existing_user.hashed_password = get_password_hash(body.new_password)
     session.add(existing_user)
     session.commit()
+    user_cache.invalidate(user_id=existing_user.id, email=email)
     revoke_all_tokens(session, email)  # Force logout after password reset
     return common.Message(message=translate(request, "password_reset_successful"))
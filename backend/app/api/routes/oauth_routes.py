@@ -114,7 +114,7 @@ async def google_auth_callback(request: Request, session: SessionDep):
                 session, email, user_info, "google"
             )
         request.session.pop("oauth_state", None)
-        return generate_tokens_and_respond(request, session, existing_user.email)
+        return generate_tokens_and_respond(request, session, existing_user)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -200,7 +200,7 @@ async def facebook_auth_callback(request: Request, session: SessionDep):
             existing_user = crud_user.create_social_user(
                 session, email, user_info, "facebook"
             )
-        return generate_tokens_and_respond(request, session, existing_user.email)
+        return generate_tokens_and_respond(request, session, existing_user)
     except Exception as e:
         raise HTTPException(
             status_code=500,
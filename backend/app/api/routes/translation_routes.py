@@ -1,15 +1,22 @@
 import uuid
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
+from app.core.config.settings import settings
 from app.core.security.dependencies import SessionDep, get_current_active_superuser
+from app.core.utils.translation_bundles import TranslationBundle, etag_matches
+from app.core.utils.translation_export import EXPORT_MEDIA_TYPES, ExportFormat
 from app.core.utils.translation_helper import translate
 from app.models.translation import (
+    TranslationChangesPublic,
     TranslationCreate,
     TranslationCreateSchema,
+    TranslationDelta,
     TranslationPublic,
+    TranslationsPublic,
     TranslationUpdate,
 )
 from app.services import translation_service
@@ -46,6 +53,246 @@ async def create_translation_route(
     }
 
 
+# Clients revalidate with If-None-Match; content-hashed URLs never change
+BUNDLE_CACHE_CONTROL = "no-cache"
+IMMUTABLE_BUNDLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class TranslationBundleInfo(BaseModel):
+    language_code: str
+    # None while the language is not loaded; `url` then is not content-hashed
+    content_hash: str | None = None
+    url: str
+
+
+def _bundle_response(
+    request: Request, bundle: TranslationBundle, cache_control: str
+) -> Response:
+    """
+    Serve a pre-serialized bundle, gzip-encoded when the client accepts it,
+    or an empty 304 when the client already holds this version.
+    """
+    use_gzip = "gzip" in request.headers.get("accept-encoding", "")
+    headers = {
+        "ETag": bundle.gzip_etag if use_gzip else bundle.etag,
+        "Cache-Control": cache_control,
+        "Vary": "Accept-Encoding",
+    }
+    if etag_matches(
+        request.headers.get("if-none-match"), bundle.etag, bundle.gzip_etag
+    ):
+        return Response(status_code=304, headers=headers)
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(bundle.gzipped, media_type="application/json", headers=headers)
+    return Response(bundle.body, media_type="application/json", headers=headers)
+
+
+def _bundle_url(bundle: TranslationBundle) -> str:
+    return (
+        f"{settings.API_V1_STR}/lang/bundles/"
+        f"{bundle.language_code}/{bundle.content_hash}"
+    )
+
+
+@router.get(
+    "/bundles/",
+    response_model=list[TranslationBundleInfo],
+    operation_id="get_translation_bundles",
+)
+async def get_translation_bundles_route() -> Any:
+    """
+    List the current bundle of every language with its content-hashed URL.
+    Languages this worker has not loaded are listed with their plain URL.
+    """
+    return [
+        TranslationBundleInfo(
+            language_code=bundle.language_code,
+            content_hash=bundle.content_hash,
+            url=_bundle_url(bundle),
+        )
+        if bundle is not None
+        else TranslationBundleInfo(
+            language_code=language_code,
+            url=f"{settings.API_V1_STR}/lang/bundles/{language_code}",
+        )
+        for language_code, bundle in (
+            await translation_service.list_translation_bundles()
+        ).items()
+    ]
+
+
+@router.get(
+    "/bundles/{language_code}",
+    response_model=dict[str, str],
+    responses={304: {"description": "Not Modified"}},
+    operation_id="get_translation_bundle",
+)
+async def get_translation_bundle_route(
+    language_code: str,
+    request: Request,
+) -> Any:
+    """
+    Retrieve all translations of a language as a key -> value object.
+    Served from memory with a strong ETag; send If-None-Match to get a 304.
+    """
+    bundle = await translation_service.get_translation_bundle(language_code)
+    if bundle is None:
+        raise HTTPException(
+            status_code=404, detail=translate(request, "no_translations_found")
+        )
+    response = _bundle_response(request, bundle, BUNDLE_CACHE_CONTROL)
+    response.headers["Link"] = f'<{_bundle_url(bundle)}>; rel="canonical"'
+    return response
+
+
+@router.get(
+    "/bundles/{language_code}/{content_hash}",
+    response_model=dict[str, str],
+    responses={304: {"description": "Not Modified"}},
+    operation_id="get_immutable_translation_bundle",
+)
+async def get_immutable_translation_bundle_route(
+    language_code: str,
+    content_hash: str,
+    request: Request,
+) -> Any:
+    """
+    Retrieve a specific version of a language bundle. The URL changes whenever
+    the translations do, so responses may be cached for a year.
+    """
+    bundle = await translation_service.get_translation_bundle(language_code)
+    if bundle is None or bundle.content_hash != content_hash:
+        raise HTTPException(
+            status_code=404, detail=translate(request, "no_translations_found")
+        )
+    return _bundle_response(request, bundle, IMMUTABLE_BUNDLE_CACHE_CONTROL)
+
+
+@router.get(
+    "/changes/{language_code}",
+    response_model=TranslationChangesPublic,
+    operation_id="get_translation_changes",
+)
+async def get_translation_changes_route(
+    language_code: str,
+    db: SessionDep,
+    since: int = Query(0, ge=0),
+) -> Any:
+    """
+    Retrieve the keys of a language added, changed or deleted (value null)
+    after version `since`, plus the current version to pass next time.
+    `since=0` returns the whole catalog.
+    """
+    version, changes = translation_service.fetch_translation_changes(
+        db, language_code, since
+    )
+    return TranslationChangesPublic(
+        language_code=language_code,
+        version=version,
+        changes=[TranslationDelta(key=key, value=value) for key, value in changes],
+    )
+
+
+@router.get(
+    "/export/",
+    dependencies=[Depends(get_current_active_superuser)],
+    response_class=StreamingResponse,
+    operation_id="export_translations",
+)
+async def export_translations_route(
+    format: ExportFormat = "ndjson",
+    languages: list[str] | None = Query(None),
+    compress: bool = False,
+) -> Any:
+    """
+    Stream every translation, or those of the given languages, as NDJSON or
+    CSV ordered by language and key. Rows are read through a server-side
+    cursor, so memory use does not grow with the catalog.
+    """
+    filename = f"translations.{format}" + (".gz" if compress else "")
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    media_type = EXPORT_MEDIA_TYPES[format]
+    if compress:
+        # A compressed file download, not a transfer encoding of the CSV/NDJSON
+        media_type = "application/gzip"
+    return StreamingResponse(
+        translation_service.export_translations(format, languages, compress),
+        media_type=media_type,
+        headers=headers,
+    )
+
+
+@router.get(
+    "/listing/{language_code}",
+    response_model=TranslationsPublic,
+    operation_id="list_translations",
+)
+async def list_translations_route(
+    language_code: str,
+    db: SessionDep,
+    limit: int = Query(100, ge=1, le=1000),
+    after: str | None = None,
+    prefix: str | None = None,
+    search: str | None = None,
+    include_total: bool = False,
+) -> Any:
+    """
+    Retrieve one page of a language's translations ordered by key.
+    Pass `next_cursor` as `after` to get the next page. `prefix` filters keys,
+    `search` matches a substring of the key or value (case-insensitive).
+    `include_total` adds a planner estimate of the matching rows.
+    """
+    return translation_service.fetch_translations_page(
+        db, language_code, limit, after, prefix, search, include_total
+    )
+
+
+class TranslationImportError(BaseModel):
+    line: int
+    error: str
+
+
+class TranslationImportReport(BaseModel):
+    lines: int
+    chunks: int
+    upserted: int
+    unchanged: int
+    failed: int
+    errors: list[TranslationImportError]
+
+
+@router.post(
+    "/import/",
+    dependencies=[Depends(get_current_active_superuser)],
+    response_model=TranslationImportReport,
+    operation_id="import_translations",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {
+                    "schema": TranslationCreateSchema.model_json_schema()
+                }
+            },
+        }
+    },
+)
+async def import_translations_route(
+    request: Request,
+    db: SessionDep,
+    chunk_size: int = Query(1000, ge=1, le=10000),
+) -> Any:
+    """
+    Import translations from an NDJSON body, one TranslationCreateSchema
+    object per line. The body is read as a stream and upserted in
+    transactions of `chunk_size` rows; invalid lines are skipped and reported.
+    """
+    return await translation_service.import_translations_ndjson(
+        db, request.stream(), chunk_size
+    )
+
+
 @router.get(
     "/{language_code}",
     response_model=list[TranslationPublic],
@@ -105,7 +352,7 @@ async def update_translation_route(
     Update an existing translation.
     """
     updated_translation = await translation_service.modify_translation(
-        db, translation_id, translation_in
+        db, translation_id, translation_in.model_dump(exclude_unset=True)
     )
     return {
         "message": translate(request, "translation_updated"),
@@ -165,28 +412,20 @@ async def bulk_insert_translations_route(
     request: Request = None,
 ) -> Any:
     """
-    Bulk insert translations and return a success or failure message.
+    Bulk insert translations in a single transaction.
+    Rows whose (language_code, key) already exists are skipped and reported.
     """
-    inserted_count = 0
-    failed_keys = []
-
-    for translation in translations:
-        try:
-            await translation_service.add_translation(
-                db, translation.language_code, translation.key, translation.value
-            )
-            inserted_count += 1
-        except Exception:
-            failed_keys.append(translation.key)
-
-    # Commit changes after processing all translations
-    db.commit()
+    inserted_count, conflicts = await translation_service.add_translations_bulk(
+        db, [translation.model_dump() for translation in translations]
+    )
 
-    if inserted_count == len(translations):
+    if not conflicts:
         message = translate(request, "new_translation_created")
     else:
         message = translate(
-            request, "translation_creation_failed", keys=", ".join(failed_keys)
+            request,
+            "translation_creation_failed",
+            keys=", ".join(conflict["key"] for conflict in conflicts),
         )
 
-    return {"message": message}
+    return {"message": message, "inserted": inserted_count, "conflicts": conflicts}
@@ -11,7 +11,9 @@ from app.services import user_service
 router = APIRouter()
 
 
-@router.patch("/me", response_model=user.UserPublic, operation_id="update_current_user")
+@router.patch(
+    "/me", response_model=user.UserUpdateMePublic, operation_id="update_current_user"
+)
 def update_user_me(
     session: SessionDep,
     user_in: user.UserUpdateMe,
@@ -1,35 +1,250 @@
 import asyncio
+import json
 import logging
 
-from app.core.database.database import SessionLocal  # Your session factory
-from app.core.utils.cache_utils import save_translations_to_cache
-from app.services.translation_service import fetch_all_translations_bulk
+import psycopg
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config.settings import settings
+from app.core.database.database import SessionLocal, engine  # Your session factory
+from app.core.utils.cache_utils import (
+    cache_file_lock,
+    change_log_offset,
+    compact_translation_cache,
+)
+from app.core.utils.compiled_catalog import (
+    COMPILED_CATALOG_FILE,
+    write_compiled_catalog,
+)
+from app.core.utils.translation_catalog import catalog
+from app.crud.crud_translation import TRANSLATION_CHANGES_CHANNEL
+from app.services.translation_service import (
+    apply_translation_change,
+    collect_translations,
+    fetch_language_codes,
+    fetch_translation_fingerprint,
+)
 
 logger = logging.getLogger(__name__)
 
+# Strong references to running tasks, so they are not garbage collected
+_background_tasks: set[asyncio.Task] = set()
+
+# Fingerprint of the table as of this worker's last full load from the database
+_loaded_fingerprint: list | None = None
+
+# Reloads replace whole languages; running two at once could install the
+# older read last
+_reload_lock = asyncio.Lock()
+
+
+async def reload_translation_cache(persist: bool = True) -> None:
+    """
+    Replace the in-memory catalog with the translations in the database.
+    - `persist` writes a new version of the cache files (compacting the
+      change log into it) and maps the compiled catalog, so all workers of
+      the node can share one read-only copy.
+    - Without `persist` only the languages resident in this worker are re-read;
+      the others are loaded on their next use.
+    - The database reads and file writes run in a worker thread.
+    """
+    async with _reload_lock:
+        await run_in_threadpool(_reload_translation_cache, persist)
+
+
+async def reload_translation_languages(language_codes: list[str]) -> None:
+    """Re-read only the given languages from the database, off the event loop."""
+    async with _reload_lock:
+        await run_in_threadpool(_reload_translation_languages, language_codes)
+
+
+def _reload_translation_cache(persist: bool) -> None:
+    if not persist:
+        _refresh_translation_cache(persist=False)
+        return
+    # Changes logged before the fetch are in the snapshot; holding the lock
+    # keeps other workers from compacting the log until it is written
+    with cache_file_lock():
+        _refresh_translation_cache(persist=True, log_offset=change_log_offset())
+
+
+def _refresh_translation_cache(persist: bool, log_offset: int = 0) -> None:
+    global _loaded_fingerprint
+    # Create a new session explicitly from SessionLocal
+    with SessionLocal() as db:
+        # Taken before the fetch: a concurrent write makes the next check reload
+        fingerprint = fetch_translation_fingerprint(db)
+        languages = fetch_language_codes(db)
+        catalog.set_known_languages(languages)
+        # Includes resident languages that no longer exist, which become empty
+        resident = list(catalog.snapshot())
+        codes = languages if persist else resident
+        logger.info("Refreshing translation cache for languages: %s", codes)
+        translations = collect_translations(db, codes)
+    _loaded_fingerprint = fingerprint
+    if persist:
+        if not translations:
+            logger.warning("No translations were fetched from the database.")
+            return
+        version = compact_translation_cache(translations, fingerprint, log_offset)
+        if version:
+            try:
+                write_compiled_catalog(COMPILED_CATALOG_FILE, translations, version)
+            except Exception as e:
+                logger.error("Failed to write compiled translation catalog: %s", e)
+            catalog.load()
+            logger.info("Translation cache refreshed successfully.")
+            return
+    catalog.replace_languages({code: translations.get(code, {}) for code in resident})
+    logger.info("Translation cache refreshed successfully.")
+
+
+def _reload_translation_languages(language_codes: list[str]) -> None:
+    # Languages that are not resident are read in full on their next use;
+    # new ones only need to become known
+    catalog.set_known_languages(catalog.language_codes() | set(language_codes))
+    resident = [code for code in language_codes if catalog.is_resident(code)]
+    if not resident:
+        return
+    with SessionLocal() as db:
+        translations = collect_translations(db, resident)
+    catalog.replace_languages(translations)
+
+
+class TranslationReloads:
+    """
+    Reload requests received over NOTIFY, coalesced: requests that arrive
+    while a reload waits or runs are merged into the next one, per language
+    or as a single full reload.
+    - Changes received meanwhile are applied after the reload, in order, so a
+      reload that read the database before them cannot overwrite them.
+    """
+
+    def __init__(self) -> None:
+        self._languages: set[str] = set()
+        self._full = False
+        self._deferred: list[dict[str, str]] = []
+        self._running = False
+        self._wakeup = asyncio.Event()
+
+    @property
+    def pending(self) -> bool:
+        return self._running or self._wakeup.is_set()
+
+    def submit(self, change: dict[str, str]) -> None:
+        """Handle one notification: apply a change or schedule a reload."""
+        if change.get("op") == "reload":
+            self.request(change.get("language_code"))
+        elif self.pending:
+            self._deferred.append(change)
+        else:
+            apply_translation_change(change)
+
+    def request(self, language_code: str | None = None) -> None:
+        """Schedule a reload of one language, or of all of them if None."""
+        if language_code is None:
+            self._full = True
+        else:
+            self._languages.add(language_code)
+        self._wakeup.set()
+
+    async def run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            # Let the rest of a burst arrive before reading the database
+            await asyncio.sleep(settings.TRANSLATION_RELOAD_COALESCE_SECONDS)
+            self._wakeup.clear()
+            full, languages = self._full, sorted(self._languages)
+            self._full, self._languages = False, set()
+            self._running = True
+            try:
+                if full:
+                    await reload_translation_cache(persist=False)
+                else:
+                    await reload_translation_languages(languages)
+            except Exception as e:
+                logger.error("Error reloading translations: %s", e)
+            finally:
+                self._running = False
+                deferred, self._deferred = self._deferred, []
+                for change in deferred:
+                    apply_translation_change(change)
+
+
+translation_reloads = TranslationReloads()
+
+
+def translation_table_changed() -> bool:
+    """Return True if the table changed since this worker last loaded it."""
+    with SessionLocal() as db:
+        return fetch_translation_fingerprint(db) != _loaded_fingerprint
+
 
 async def refresh_translation_cache():
-    languages = ["en", "cs"]  # Add more languages if needed
+    global _loaded_fingerprint
+    # The catalog loaded at startup came from the cache file
+    _loaded_fingerprint = _loaded_fingerprint or catalog.fingerprint
     while True:
-        logger.info("Refreshing translation cache for languages: %s", languages)
         try:
-            # Create a new session explicitly from SessionLocal
-            with SessionLocal() as db:
-                # fetch_all_translations_bulk should return a list or a dict with all translations.
-                translations = await fetch_all_translations_bulk(db, languages)
-                if translations:
-                    save_translations_to_cache(translations)
-                    logger.info(
-                        "Translation cache refreshed successfully. Cache file updated."
-                    )
-                else:
-                    logger.warning("No translations were fetched from the database.")
+            # Adopt a catalog version another worker wrote since the last round
+            # instead of querying the database again.
+            if await run_in_threadpool(catalog.reload_if_changed):
+                # ...along with the database state that worker read
+                _loaded_fingerprint = catalog.fingerprint
+                logger.info("Loaded translation cache version %d.", catalog.version)
+            elif await run_in_threadpool(translation_table_changed):
+                await reload_translation_cache()
+            else:
+                logger.info("Translations unchanged; skipping cache refresh.")
         except Exception as e:
             logger.error("Error refreshing translation cache: %s", e)
-        await asyncio.sleep(3600)  # Wait one hour before refreshing again
+        # Full reloads are only a safety net; changes arrive via LISTEN/NOTIFY
+        await asyncio.sleep(settings.TRANSLATION_CACHE_REFRESH_SECONDS)
+
+
+async def listen_for_translation_changes():
+    """
+    Apply translation changes made by any worker on any node as soon as they
+    are committed, using Postgres LISTEN on a dedicated connection.
+    - After every reconnect the catalog is reloaded once, so changes missed
+      while disconnected are not lost (the first connect relies on the
+      refresh that runs at startup).
+    - Reloads are handed to `translation_reloads`, so the loop keeps reading
+      notifications while the database is queried.
+    """
+    conninfo = engine.url.set(drivername="postgresql").render_as_string(
+        hide_password=False
+    )
+    reconnecting = False
+    while True:
+        try:
+            async with await psycopg.AsyncConnection.connect(
+                conninfo, autocommit=True
+            ) as conn:
+                await conn.execute(f"LISTEN {TRANSLATION_CHANGES_CHANNEL}")
+                logger.info(
+                    "Listening for translation changes on '%s'.",
+                    TRANSLATION_CHANGES_CHANNEL,
+                )
+                if reconnecting:
+                    translation_reloads.request()
+                reconnecting = True
+                async for notify in conn.notifies():
+                    translation_reloads.submit(json.loads(notify.payload))
+        except Exception as e:
+            logger.error("Translation change listener failed: %s", e)
+        await asyncio.sleep(settings.TRANSLATION_LISTENER_RETRY_SECONDS)
+
+
+def _start_task(coro) -> None:
+    task = asyncio.get_event_loop().create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
 
 
 def start_cache_refresh():
-    loop = asyncio.get_event_loop()
-    loop.create_task(refresh_translation_cache())
+    _start_task(refresh_translation_cache())
     logger.info("Started translation cache refresh background task.")
+    _start_task(translation_reloads.run())
+    _start_task(listen_for_translation_changes())
+    logger.info("Started translation change listener background task.")
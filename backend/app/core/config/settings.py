@@ -96,6 +96,34 @@ class Settings(BaseSettings):
     def emails_enabled(self) -> bool:
         return bool(self.SMTP_HOST and self.EMAILS_FROM_EMAIL)
 
+    # Server processes per node; uvicorn reads the same variable for --workers.
+    WEB_CONCURRENCY: int = 1
+
+    # bcrypt runs in a dedicated pool (see app/core/security/password_hashing.py).
+    # Workers defaults to the node's CPUs divided by WEB_CONCURRENCY; at most
+    # MAX_PENDING jobs per process are queued.
+    PASSWORD_HASH_EXECUTOR: Literal["process", "thread"] = "process"
+    PASSWORD_HASH_WORKERS: int | None = None
+    PASSWORD_HASH_MAX_PENDING: int = 64
+
+    # Per-process cache of authenticated users (see app/core/security/user_cache.py).
+    # Writes invalidate locally; the TTL bounds staleness across workers.
+    USER_CACHE_MAX_SIZE: int = 10_000
+    USER_CACHE_TTL_SECONDS: int = 60
+
+    # Translation writes are pushed to every worker via LISTEN/NOTIFY
+    # (see app/core/background_tasks.py); the periodic full reload is a safety net.
+    TRANSLATION_CACHE_REFRESH_SECONDS: int = 3600
+    TRANSLATION_LISTENER_RETRY_SECONDS: int = 5
+    # Reload notifications arriving within this window are merged into one reload.
+    TRANSLATION_RELOAD_COALESCE_SECONDS: float = 0.5
+    # Directory of the translation cache files shared by all workers of a node,
+    # e.g. a tmpfs mount such as /dev/shm/swifter.
+    TRANSLATION_CACHE_DIR: str = "."
+    # Per-worker budget for languages held as dicts; least recently used ones
+    # are evicted and reloaded on demand. 0 keeps every language resident.
+    TRANSLATION_CATALOG_MAX_BYTES: int = 0
+
     EMAIL_TEST_USER: str = "test@example.com"
     FIRST_SUPERUSER: str
     FIRST_SUPERUSER_PASSWORD: str
@@ -0,0 +1,82 @@
+"""
+Load locale packs into the translation table with COPY.
+
+Usage (from ./backend/):
+
+    python -m app.core.database.load_translations packs/de.ndjson packs/fr.csv.gz
+
+Files are NDJSON (one {"language_code", "key", "value"} object per line) or
+CSV with a language_code,key,value header, as produced by GET /lang/export/,
+optionally gzip-compressed. Existing keys are updated; running workers are
+notified and refresh their catalogs.
+"""
+
+import argparse
+import csv
+import gzip
+import json
+import logging
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from app.core.database.database import SessionLocal
+from app.crud.crud_translation import copy_translations
+from app.models.translation import TranslationCreateSchema
+
+# Configure Logging
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def read_translation_file(path: Path) -> Iterator[tuple[str, str, str]]:
+    """Yield validated (language_code, key, value) rows from a locale pack."""
+    suffixes = path.suffixes
+    opener = gzip.open if suffixes[-1:] == [".gz"] else open
+    is_csv = ".csv" in suffixes
+    with opener(path, "rt", encoding="utf-8", newline="") as file:
+        records = csv.DictReader(file) if is_csv else file
+        for number, record in enumerate(records, start=1):
+            if not is_csv and not record.strip():
+                continue
+            try:
+                row = TranslationCreateSchema.model_validate(
+                    record if is_csv else json.loads(record)
+                )
+            except (ValidationError, ValueError) as e:
+                raise ValueError(f"{path}: record {number}: {e}") from e
+            yield row.language_code, row.key, row.value
+
+
+def load_translations(paths: list[Path]) -> int:
+    """Load all files in one transaction; returns the number of changed rows."""
+
+    def rows() -> Iterator[tuple[str, str, str]]:
+        for path in paths:
+            logger.info(f"Loading {path}...")
+            yield from read_translation_file(path)
+
+    with SessionLocal() as session:
+        return sum(copy_translations(session, rows()).values())
+
+
+def main() -> None:
+    """Main function to load locale packs."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("paths", nargs="+", type=Path, help="NDJSON or CSV files")
+    args = parser.parse_args()
+
+    try:
+        changed = load_translations(args.paths)
+    except Exception as e:
+        logger.error(f"Loading translations failed: {e}", exc_info=True)
+        sys.exit(1)
+    logger.info(f"Translations loaded: {changed} added or changed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,81 +1,103 @@
 import logging
 
-import jwt
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from app.core.config.settings import settings
 from app.core.database.database import SessionLocal
-from app.core.security.refresh_token_service import ALGORITHM
-from app.core.utils.cache_utils import load_translations_from_cache
-from app.crud import crud_user
+from app.core.security.principal import RequestPrincipal
+from app.core.utils.language_negotiation import negotiator
+from app.core.utils.translation_catalog import catalog
+from app.models.user import User
 
 logger = logging.getLogger(__name__)
 
 
-def setup_language_middleware(app):
-    class LanguageMiddleware(BaseHTTPMiddleware):
-        async def dispatch(self, request: Request, call_next):
-            user_language = "en"
-
-            try:
-                auth_header = request.headers.get("authorization")
-                logger.info(f"LanguageMiddleware: Received Auth Header: {auth_header}")
-
-                if auth_header and auth_header.startswith("Bearer "):
-                    token = auth_header.split(" ")[1]
-
-                    # Decode token
-                    payload = jwt.decode(
-                        token, settings.SECRET_KEY, algorithms=[ALGORITHM]
-                    )
-                    user_email = payload.get("sub")  # Extract email
-                    logger.info(
-                        f"LanguageMiddleware: Decoded User Email from Token: {user_email}"
-                    )
-
-                    if user_email:
-                        # Manually create a database session
-                        session = SessionLocal()
-                        try:
-                            user = crud_user.get_user_by_email(
-                                session=session, email=user_email
-                            )
-                            if user:
-                                logger.info(
-                                    f"LanguageMiddleware: Retrieved User - {user.email} | Preferred Language: {user.preferred_language}"
-                                )
-                                user_language = user.preferred_language
-                            else:
-                                logger.warning(
-                                    f"LanguageMiddleware: No user found with email {user_email}"
-                                )
-                        finally:
-                            session.close()  # Ensure session is closed
-
-                # Fallback if no user found
-                if user_language == "en":
-                    headers = dict(request.headers)
-                    user_language = (
-                        headers.get("accept-language", "en").split(",")[0].strip()
-                    )
-                    logger.info(
-                        f"LanguageMiddleware: No user language set, falling back to '{user_language}' from headers"
-                    )
-
-            except Exception as e:
-                logger.error(
-                    f"LanguageMiddleware: Error retrieving user language - {str(e)}"
+def load_principal_user(principal: RequestPrincipal) -> User | None:
+    """
+    Load the user behind `principal` so the auth dependencies can reuse it.
+    Blocking: call it from a worker thread, never from the event loop.
+    """
+    with SessionLocal() as session:
+        return principal.load_user(session)
+
+
+class LanguageMiddleware:
+    """
+    Pure ASGI middleware that resolves the request language and stores it,
+    together with the matching translations, in `scope["state"]`.
+
+    Unlike `BaseHTTPMiddleware` it does not wrap the response stream, and the
+    database lookup runs in the threadpool so the event loop is never blocked.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        state = scope.setdefault("state", {})
+        headers = Headers(scope=scope)
+
+        # Decode the bearer token once; the auth dependencies reuse it
+        auth_header = headers.get("authorization")
+        if auth_header and auth_header.startswith("Bearer "):
+            state["principal"] = RequestPrincipal(auth_header.split(" ")[1])
+
+        user_language = await self.resolve_language(headers, state.get("principal"))
+        missing = catalog.missing_languages(user_language)
+        if missing:
+            await run_in_threadpool(catalog.ensure_loaded, *missing)
+        # Already merged along the fallback chain, e.g. cs-CZ -> cs -> en
+        translations = catalog.get_locale(user_language)
+        # No len(): counting the overlay's keys walks the whole chain
+        logger.debug("LanguageMiddleware: Loaded translations for '%s'", user_language)
+
+        state["language"] = user_language
+        state["translations"] = translations
+        await self.app(scope, receive, send)
+
+    async def resolve_language(
+        self, headers: Headers, principal: RequestPrincipal | None
+    ) -> str:
+        user_language = "en"
+
+        try:
+            if principal is not None and principal.payload is not None:
+                # Prefer the cached row: updates invalidate it and it expires
+                # after the cache TTL, while the claim is as old as the token
+                cached_user = principal.cached_user()
+                if cached_user is not None:
+                    user_language = cached_user.preferred_language
+                elif principal.payload.preferred_language:
+                    user_language = principal.payload.preferred_language
+                else:
+                    user = await run_in_threadpool(load_principal_user, principal)
+                    if user:
+                        user_language = user.preferred_language
+                    else:
+                        logger.warning(
+                            f"LanguageMiddleware: No user found with email {principal.payload.sub}"
+                        )
+
+            # Fallback if no user language found
+            if user_language == "en":
+                user_language = negotiator.negotiate(headers.get("accept-language"))
+                logger.debug(
+                    f"LanguageMiddleware: No user language set, falling back to '{user_language}' from headers"
                 )
 
-            # Load translations from cache
-            translations = load_translations_from_cache().get(user_language, {})
-            logger.info(
-                f"LanguageMiddleware: Loaded {len(translations)} translations for '{user_language}'"
+        except Exception as e:
+            logger.error(
+                f"LanguageMiddleware: Error retrieving user language - {str(e)}"
             )
 
-            request.state.translations = translations
-            response = await call_next(request)
-            return response
+        return user_language
+
 
+def setup_language_middleware(app):
+    """Configure LanguageMiddleware for the application."""
     app.add_middleware(LanguageMiddleware)
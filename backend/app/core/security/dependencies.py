@@ -1,15 +1,11 @@
 from typing import Annotated
 
-import jwt
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from jwt.exceptions import InvalidTokenError
-from pydantic import ValidationError
-from sqlmodel import select
 
 from app.core.config.settings import settings
 from app.core.database.dependencies import SessionDep
-from app.core.security.refresh_token_service import ALGORITHM
+from app.core.security.principal import get_request_principal
 from app.core.utils.translation_helper import translate
 from app.models.auth import TokenPayload
 from app.models.user import User
@@ -18,20 +14,27 @@ reusable_oauth2 = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/log
 TokenDep = Annotated[str, Depends(reusable_oauth2)]
 
 
-def get_current_user(session: SessionDep, token: TokenDep, request: Request) -> User:
+def get_token_payload(token: TokenDep, request: Request) -> TokenPayload:
     """
-    Retrieve the current user from the JWT token.
+    Decode the JWT token without touching the database.
+    The decoded token is shared with LanguageMiddleware through request state.
     """
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
-        token_data = TokenPayload(**payload)
-    except (InvalidTokenError, ValidationError):
+    principal = get_request_principal(request, token)
+    if principal.payload is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=translate(request, "could_not_validate_credentials"),
         )
-    statement = select(User).where(User.email == token_data.sub)
-    user = session.exec(statement).first()
+    return principal.payload
+
+
+def get_current_user(session: SessionDep, token: TokenDep, request: Request) -> User:
+    """
+    Retrieve the current user from the JWT token.
+    The user is loaded once per request and reused by every dependency.
+    """
+    get_token_payload(token, request)
+    user = get_request_principal(request, token).load_user(session)
     if not user:
         raise HTTPException(
             status_code=404, detail=translate(request, "user_not_found")
@@ -0,0 +1,122 @@
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from app.core.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class HashingExecutor:
+    """
+    Dedicated, bounded pool for CPU-heavy password hashing (bcrypt).
+    - A process pool by default, so hashing scales across cores instead of
+      competing for the GIL with request threads.
+    - At most `max_pending` jobs are queued or running; further callers wait
+      for a slot, which keeps memory and tail latency bounded under a storm.
+    """
+
+    def __init__(self, kind: str, max_workers: int, max_pending: int) -> None:
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: Executor | None = None
+        self._executor_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._stats_lock = threading.Lock()
+        # Callers waiting for a slot, queued in the pool or running
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.completed = 0
+        self.total_wait_seconds = 0.0
+        self.total_run_seconds = 0.0
+
+    def start(self) -> None:
+        """Create the pool eagerly (e.g. at startup) instead of on first use."""
+        with self._executor_lock:
+            if self._executor is not None:
+                return
+            if self.kind == "process":
+                # "spawn" avoids forking a process that already runs threads
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="password-hash"
+                )
+            logger.info(
+                "Started password hashing %s pool with %d workers.",
+                self.kind,
+                self.max_workers,
+            )
+
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run `fn(*args)` in the pool and block until its result is ready."""
+        self.start()
+        queued_at = time.perf_counter()
+        self._track(1)
+        try:
+            with self._slots:
+                future = self._executor.submit(fn, *args)
+                started_at = time.perf_counter()
+                result = future.result()
+        finally:
+            self._track(-1)
+        self._record(queued_at, started_at)
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        with self._stats_lock:
+            return {
+                "kind": self.kind,
+                "max_workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "queue_depth": self.queue_depth,
+                "max_queue_depth": self.max_queue_depth,
+                "completed": self.completed,
+                "avg_wait_ms": (self.total_wait_seconds / self.completed * 1000)
+                if self.completed
+                else 0.0,
+                "avg_run_ms": (self.total_run_seconds / self.completed * 1000)
+                if self.completed
+                else 0.0,
+            }
+
+    def _record(self, queued_at: float, started_at: float) -> None:
+        finished_at = time.perf_counter()
+        with self._stats_lock:
+            self.completed += 1
+            self.total_wait_seconds += started_at - queued_at
+            self.total_run_seconds += finished_at - started_at
+
+    def _track(self, delta: int) -> None:
+        with self._stats_lock:
+            self.queue_depth += delta
+            self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+
+
+def default_workers() -> int:
+    """Share the node's CPUs between the WEB_CONCURRENCY server processes."""
+    return max(1, (os.cpu_count() or 1) // max(1, settings.WEB_CONCURRENCY))
+
+
+hashing_executor = HashingExecutor(
+    kind=settings.PASSWORD_HASH_EXECUTOR,
+    max_workers=settings.PASSWORD_HASH_WORKERS or default_workers(),
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
@@ -5,6 +5,7 @@ from jwt.exceptions import ExpiredSignatureError, InvalidTokenError
 from passlib.context import CryptContext
 
 from app.core.config.settings import settings
+from app.core.security.password_hashing import hashing_executor
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -12,14 +13,24 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 ALGORITHM = "HS256"
 
 
+def _bcrypt_verify(plain_password: str, hashed_password: str) -> bool:
+    # Runs inside the hashing pool; must stay a picklable module-level function.
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def _bcrypt_hash(password: str) -> str:
+    # Runs inside the hashing pool; must stay a picklable module-level function.
+    return pwd_context.hash(password)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plaintext password against a hashed password."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return hashing_executor.run(_bcrypt_verify, plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
     """Hash a password using bcrypt."""
-    return pwd_context.hash(password)
+    return hashing_executor.run(_bcrypt_hash, password)
 
 
 def generate_password_reset_token(
@@ -0,0 +1,75 @@
+import jwt
+from fastapi import Request
+from jwt.exceptions import InvalidTokenError
+from pydantic import ValidationError
+from sqlmodel import Session, select
+
+from app.core.config.settings import settings
+from app.core.security.refresh_token_service import ALGORITHM
+from app.core.security.user_cache import user_cache
+from app.models.auth import TokenPayload
+from app.models.user import User
+
+
+class RequestPrincipal:
+    """
+    Identity behind the bearer token of a single request.
+    - The token is decoded once, when the principal is created.
+    - The `User` row is loaded at most once, by whichever of LanguageMiddleware
+      or the auth dependencies needs it first, and then shared via request state.
+    """
+
+    def __init__(self, token: str) -> None:
+        self.token = token
+        self._user: User | None = None
+        self._user_loaded = False
+        try:
+            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
+            self.payload: TokenPayload | None = TokenPayload(**payload)
+        except (InvalidTokenError, ValidationError):
+            self.payload = None
+
+    def cached_user(self) -> User | None:
+        """
+        Return the user from the user cache without querying, or None.
+        - Looked up by the `user_id` claim when the token has one, so a row
+          cached under a changed email is still found.
+        """
+        if self.payload is None:
+            return None
+        if self.payload.user_id is not None:
+            return user_cache.get_by_id(self.payload.user_id)
+        return user_cache.get_by_email(self.payload.sub)
+
+    def load_user(self, session: Session) -> User | None:
+        """
+        Return the user the token was issued for.
+        - Served from the user cache when possible, otherwise queried once.
+        - A user loaded through another session (or the cache) is attached to
+          `session` without a new query, so routes can keep modifying it.
+        """
+        if self.payload is None:
+            return None
+        if not self._user_loaded:
+            self._user = user_cache.get_by_email(self.payload.sub)
+            if self._user is None:
+                statement = select(User).where(User.email == self.payload.sub)
+                self._user = session.exec(statement).first()
+                if self._user is not None:
+                    user_cache.put(self._user)
+            self._user_loaded = True
+        if self._user is not None and self._user not in session:
+            self._user = session.merge(self._user, load=False)
+        return self._user
+
+
+def get_request_principal(request: Request, token: str) -> RequestPrincipal:
+    """
+    Return the principal stored on the request, creating it if the middleware
+    did not (e.g. the token came from somewhere other than the header).
+    """
+    principal = getattr(request.state, "principal", None)
+    if principal is None or principal.token != token:
+        principal = RequestPrincipal(token)
+        request.state.principal = principal
+    return principal
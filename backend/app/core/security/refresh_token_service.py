@@ -1,21 +1,35 @@
+import hashlib
+import uuid
 from datetime import datetime, timedelta, timezone
 
 import jwt
 from fastapi import HTTPException, Request
-from sqlmodel import Session, select
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, delete, select
 
 from app.core.config.settings import settings
 from app.core.utils.translation_helper import translate
 from app.models.token import RefreshToken
+from app.models.user import User
 
 ALGORITHM = "HS256"
 
 
 def create_access_token(
-    email: str, expires_delta: timedelta, auth_provider: str = "local"
+    email: str,
+    expires_delta: timedelta,
+    auth_provider: str = "local",
+    *,
+    user_id: uuid.UUID | None = None,
+    preferred_language: str | None = None,
 ) -> str:
     """
     Generate a short-lived JWT access token.
+    - Identity claims (`user_id`, `preferred_language`) are only embedded when
+      given, so LanguageMiddleware can skip the user lookup.
+    - Authorization is never taken from the token; privileges are read from
+      the database so changes apply immediately.
     """
     expire = datetime.now(timezone.utc) + expires_delta
     to_encode = {
@@ -23,42 +37,128 @@ def create_access_token(
         "sub": email,
         "auth_provider": auth_provider,
     }
+    if user_id is not None:
+        to_encode["user_id"] = str(user_id)
+    if preferred_language is not None:
+        to_encode["preferred_language"] = preferred_language
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
 
 
+def create_user_access_token(user: User, expires_delta: timedelta | None = None) -> str:
+    """
+    Generate an access token for `user` carrying its identity claims.
+    """
+    if expires_delta is None:
+        expires_delta = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    return create_access_token(
+        user.email,
+        expires_delta=expires_delta,
+        auth_provider=user.auth_provider,
+        user_id=user.id,
+        preferred_language=user.preferred_language,
+    )
+
+
+def hash_refresh_token(refresh_token: str) -> str:
+    """
+    Return the fixed-length digest under which a refresh token is stored.
+    """
+    return hashlib.sha256(refresh_token.encode()).hexdigest()
+
+
+def _encode_refresh_token(
+    email: str, expire_at: datetime, auth_provider: str = "local"
+) -> str:
+    return jwt.encode(
+        {"exp": expire_at.timestamp(), "sub": email, "auth_provider": auth_provider},
+        settings.REFRESH_SECRET_KEY,
+        algorithm=ALGORITHM,
+    )
+
+
 def create_refresh_token(
     session: Session, email: str, expires_delta: timedelta, auth_provider: str = "local"
 ) -> str:
     """
     Create or update a refresh token for the user.
-    - If a refresh token exists, update it instead of creating a new one.
-    - If none exists, create a new one.
+    - A single `INSERT ... ON CONFLICT (user_email) DO UPDATE` replaces the
+      user's existing token or creates the first one.
     """
     expire_at = datetime.now(timezone.utc) + expires_delta
-    encoded_jwt = jwt.encode(
-        {"exp": expire_at.timestamp(), "sub": email, "auth_provider": auth_provider},
-        settings.REFRESH_SECRET_KEY,
-        algorithm=ALGORITHM,
+    encoded_jwt = _encode_refresh_token(email, expire_at, auth_provider)
+
+    statement = insert(RefreshToken).values(
+        id=uuid.uuid4(),
+        user_email=email,
+        token_hash=hash_refresh_token(encoded_jwt),
+        expires_at=expire_at,
+        created_at=datetime.now(timezone.utc),
+    )
+    session.execute(
+        statement.on_conflict_do_update(
+            index_elements=[RefreshToken.user_email],
+            set_={
+                "token_hash": statement.excluded.token_hash,
+                "expires_at": statement.excluded.expires_at,
+            },
+        )
     )
+    session.commit()
+    return encoded_jwt
 
-    # Check if a refresh token already exists for this user
-    existing_token = session.exec(
-        select(RefreshToken).where(RefreshToken.user_email == email)
-    ).first()
 
-    if existing_token:
-        # Update existing refresh token
-        existing_token.token = encoded_jwt
-        existing_token.expires_at = expire_at
-    else:
-        # Create a new refresh token record
-        new_refresh_token = RefreshToken(
-            user_email=email, token=encoded_jwt, expires_at=expire_at
+def rotate_refresh_token(
+    session: Session, refresh_token: str, expires_delta: timedelta, request: Request
+) -> tuple[str, str, str]:
+    """
+    Exchange a refresh token for a new one and return
+    (new_refresh_token, email, auth_provider).
+    - One `UPDATE ... WHERE token_hash = <old> RETURNING` both validates and
+      replaces the stored token, so of two concurrent refreshes only one wins.
+    Error messages are localized using the translate() function.
+    """
+    try:
+        payload = jwt.decode(
+            refresh_token, settings.REFRESH_SECRET_KEY, algorithms=[ALGORITHM]
+        )
+    except jwt.ExpiredSignatureError:
+        raise HTTPException(
+            status_code=401, detail=translate(request, "refresh_token_expired")
+        )
+    except jwt.InvalidTokenError:
+        raise HTTPException(
+            status_code=401, detail=translate(request, "invalid_refresh_token")
+        )
+
+    email = payload.get("sub")
+    auth_provider = payload.get("auth_provider", "local")
+    if not email:
+        raise HTTPException(
+            status_code=401, detail=translate(request, "invalid_refresh_token_payload")
+        )
+
+    now = datetime.now(timezone.utc)
+    expire_at = now + expires_delta
+    new_refresh_token = _encode_refresh_token(email, expire_at, auth_provider)
+
+    rotated = session.execute(
+        update(RefreshToken)
+        .where(
+            RefreshToken.token_hash == hash_refresh_token(refresh_token),
+            RefreshToken.expires_at > now,
+        )
+        .values(token_hash=hash_refresh_token(new_refresh_token), expires_at=expire_at)
+        .returning(RefreshToken.id)
+    ).first()
+    if rotated is None:
+        session.rollback()
+        raise HTTPException(
+            status_code=401,
+            detail=translate(request, "invalid_or_revoked_refresh_token"),
         )
-        session.add(new_refresh_token)
 
     session.commit()
-    return encoded_jwt
+    return new_refresh_token, email, auth_provider
 
 
 def verify_refresh_token(
@@ -84,7 +184,9 @@ def verify_refresh_token(
 
         # Validate that the token exists in the database
         db_token = session.exec(
-            select(RefreshToken).where(RefreshToken.token == refresh_token)
+            select(RefreshToken).where(
+                RefreshToken.token_hash == hash_refresh_token(refresh_token)
+            )
         ).first()
         if not db_token:
             raise HTTPException(
@@ -124,12 +226,12 @@ def revoke_refresh_token(session: Session, refresh_token: str) -> bool:
     Revoke a refresh token (logout).
     If the token is not found in the database, treat it as already revoked.
     """
-    db_token = session.exec(
-        select(RefreshToken).where(RefreshToken.token == refresh_token)
-    ).first()
-    if db_token:
-        session.delete(db_token)
-        session.commit()
+    session.execute(
+        delete(RefreshToken).where(
+            RefreshToken.token_hash == hash_refresh_token(refresh_token)
+        )
+    )
+    session.commit()
 
     # Return True regardless to indicate that the token is no longer valid
     return True
@@ -0,0 +1,120 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any
+
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.config.settings import settings
+from app.models.user import User
+
+
+class UserCache:
+    """
+    Bounded, per-process LRU cache of `User` rows with a TTL.
+    - Entries are looked up by email (the token subject) or by id.
+    - Rows are stored as plain column values; every hit returns a fresh,
+      detached `User` that a session can adopt without a SELECT.
+    - Writes invalidate entries explicitly; the TTL bounds staleness for
+      changes made by other workers.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._emails_by_id: dict[uuid.UUID, str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl_seconds > 0
+
+    def get_by_email(self, email: str) -> User | None:
+        """Return a detached copy of the cached user, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(email)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, data = entry
+            if time.monotonic() >= expires_at:
+                self._pop(email)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(email)
+            self.hits += 1
+
+        user = User(**data)
+        make_transient_to_detached(user)
+        return user
+
+    def get_by_id(self, user_id: uuid.UUID) -> User | None:
+        """Return a detached copy of the cached user, or None on a miss."""
+        with self._lock:
+            email = self._emails_by_id.get(user_id)
+        if email is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        return self.get_by_email(email)
+
+    def put(self, user: User) -> None:
+        """Cache the current column values of `user`."""
+        if not self.enabled:
+            return
+        data = user.model_dump()
+        with self._lock:
+            self._pop(user.email)
+            self._entries[user.email] = (time.monotonic() + self.ttl_seconds, data)
+            self._emails_by_id[user.id] = user.email
+            while len(self._entries) > self.max_size:
+                oldest_email = next(iter(self._entries))
+                self._pop(oldest_email)
+                self.evictions += 1
+
+    def invalidate(
+        self, *, email: str | None = None, user_id: uuid.UUID | None = None
+    ) -> None:
+        """Drop the entries of a user after it was modified or deleted."""
+        with self._lock:
+            if user_id is not None:
+                cached_email = self._emails_by_id.get(user_id)
+                if cached_email is not None:
+                    self._pop(cached_email)
+            if email is not None:
+                self._pop(email)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._emails_by_id.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def _pop(self, email: str) -> None:
+        entry = self._entries.pop(email, None)
+        if entry is not None:
+            user_id = entry[1].get("id")
+            if self._emails_by_id.get(user_id) == email:
+                del self._emails_by_id[user_id]
+
+
+user_cache = UserCache(
+    max_size=settings.USER_CACHE_MAX_SIZE, ttl_seconds=settings.USER_CACHE_TTL_SECONDS
+)
@@ -7,15 +7,16 @@ from starlette.responses import JSONResponse, RedirectResponse
 
 from app.core.config.settings import settings
 from app.core.security import refresh_token_service
+from app.models.user import User
 
 
-def generate_tokens_and_respond(request: Request, session: Session, user_email: str):
+def generate_tokens_and_respond(request: Request, session: Session, user: User):
     """
     Generates access and refresh tokens, and returns either JSON or redirects the user.
 
     :param request: The FastAPI request object
     :param session: The database session
-    :param user_email: The email of the authenticated user
+    :param user: The authenticated user
     :return: JSONResponse for API clients or RedirectResponse for web users
     """
     front_url = settings.FRONTEND_HOST  # Fetch from backend .env
@@ -23,11 +24,14 @@ def generate_tokens_and_respond(request: Request, session: Session, user_email:
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     refresh_token_expires = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
 
-    access_token = refresh_token_service.create_access_token(
-        user_email, expires_delta=access_token_expires
+    access_token = refresh_token_service.create_user_access_token(
+        user, expires_delta=access_token_expires
     )
     refresh_token = refresh_token_service.create_refresh_token(
-        session, user_email, expires_delta=refresh_token_expires
+        session,
+        user.email,
+        expires_delta=refresh_token_expires,
+        auth_provider=user.auth_provider,
     )
 
     accept_header = request.headers.get("accept", "")
@@ -1,40 +1,249 @@
+import fcntl
 import json
 import logging
 import os
+import tempfile
+import threading
 import uuid
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
 
-CACHE_FILE = "translation_cache.json"
+from app.core.config.settings import settings
+
+CACHE_FILE = os.path.join(settings.TRANSLATION_CACHE_DIR, "translation_cache.json")
+# Append-only log of translation changes made since CACHE_FILE was written
+CHANGE_LOG_FILE = os.path.join(
+    settings.TRANSLATION_CACHE_DIR, "translation_changes.log"
+)
 logger = logging.getLogger(__name__)
+_lock_state = threading.local()
 
 
 def default_serializer(obj):
     if isinstance(obj, uuid.UUID):
         return str(obj)
+    if isinstance(obj, Mapping):
+        return dict(obj)
     raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
 
 
-def save_translations_to_cache(translations: dict):
+def write_file_atomically(path: str, data: bytes) -> None:
+    """
+    Write `data` to a temporary file next to `path` and rename it into place,
+    so readers see either the old or the new file, never a partial one.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+@contextmanager
+def cache_file_lock() -> Iterator[None]:
+    """
+    Serialize cache file writers across processes.
+    - Re-entrant within a thread, so a caller can hold it around a whole
+      snapshot (see `compact_translation_cache`).
+    """
+    depth = getattr(_lock_state, "depth", 0)
+    if depth:
+        _lock_state.depth = depth + 1
+        try:
+            yield
+        finally:
+            _lock_state.depth = depth
+        return
+    os.makedirs(os.path.dirname(os.path.abspath(CACHE_FILE)), exist_ok=True)
+    with open(f"{CACHE_FILE}.lock", "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        _lock_state.depth = 1
+        try:
+            yield
+        finally:
+            _lock_state.depth = 0
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+# The cache file starts with a one-line JSON header, e.g.
+# {"version": 7, "fingerprint": [463, "2026-10-17T11:22:45+00:00"]}, followed by
+# the translations as JSON. Files without a header are version 0.
+def _parse_header(line: bytes) -> dict | None:
+    try:
+        header = json.loads(line)
+    except ValueError:
+        return None
+    if isinstance(header, dict) and isinstance(header.get("version"), int):
+        return header
+    return None
+
+
+def read_cache_header() -> dict:
+    """Return the header of the cache file, reading its first line only."""
+    try:
+        with open(CACHE_FILE, "rb") as file:
+            return _parse_header(file.readline()) or {"version": 0}
+    except OSError:
+        return {"version": 0}
+
+
+def read_cache_version() -> int:
+    """Return the catalog version of the cache file by reading its header only."""
+    return read_cache_header()["version"]
+
+
+def cache_file_stat() -> tuple[int, int, int] | None:
+    """Return (inode, size, mtime) of the cache file, a cheap change marker."""
+    try:
+        stat = os.stat(CACHE_FILE)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def save_translations_to_cache(
+    translations: dict, fingerprint: list | None = None
+) -> int:
+    """
+    Atomically replace the cache file under the next catalog version.
+    - `fingerprint` identifies the database state the translations were read
+      at, so workers adopting this file know what they have loaded.
+    Returns the version written (0 if writing failed).
+    """
     try:
-        with open(CACHE_FILE, "w") as file:
-            json.dump(translations, file, indent=4, default=default_serializer)
-        logger.info("Successfully saved translations to cache file '%s'.", CACHE_FILE)
+        with cache_file_lock():
+            version = read_cache_version() + 1
+            header = json.dumps({"version": version, "fingerprint": fingerprint})
+            body = json.dumps(translations, default=default_serializer)
+            write_file_atomically(CACHE_FILE, f"{header}\n{body}".encode())
+        logger.info(
+            "Successfully saved translations to cache file '%s' (version %d).",
+            CACHE_FILE,
+            version,
+        )
+        return version
     except Exception as e:
         logger.error("Failed to save translations to cache: %s", e)
+        return 0
 
 
-def load_translations_from_cache():
+def load_versioned_translations_from_cache() -> tuple[int, dict]:
+    """Return (version, translations) from the cache file."""
     if os.path.exists(CACHE_FILE):
         try:
-            with open(CACHE_FILE) as file:
-                translations = json.load(file)
+            with open(CACHE_FILE, "rb") as file:
+                first_line = file.readline()
+                header = _parse_header(first_line)
+                if header is None:
+                    # Legacy file without a header
+                    version, content = 0, first_line + file.read()
+                else:
+                    version, content = header["version"], file.read()
+            translations = json.loads(content)
             logger.info(
-                "Successfully loaded translations from cache file '%s'.", CACHE_FILE
+                "Successfully loaded translations from cache file '%s' (version %d).",
+                CACHE_FILE,
+                version,
             )
-            return translations
+            return version, translations
         except Exception as e:
             logger.error("Failed to load translations from cache: %s", e)
-            return {}
+            return 0, {}
     logger.info(
         "Cache file '%s' does not exist; returning empty translations.", CACHE_FILE
     )
-    return {}
+    return 0, {}
+
+
+def load_translations_from_cache():
+    return load_versioned_translations_from_cache()[1]
+
+
+def append_translation_changes(changes: list[dict[str, str]]) -> None:
+    """
+    Record translation changes as JSON lines at the end of the change log.
+    Costs O(changes) I/O regardless of the catalog size.
+    """
+    if not changes:
+        return
+    lines = "".join(json.dumps(change) + "\n" for change in changes)
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(CHANGE_LOG_FILE)), exist_ok=True)
+        with open(CHANGE_LOG_FILE, "a") as file:
+            fcntl.flock(file, fcntl.LOCK_EX)
+            try:
+                file.write(lines)
+            finally:
+                fcntl.flock(file, fcntl.LOCK_UN)
+    except Exception as e:
+        logger.error("Failed to append translation changes: %s", e)
+
+
+def read_translation_changes() -> list[dict[str, str]]:
+    """Return the changes recorded in the change log, oldest first."""
+    if not os.path.exists(CHANGE_LOG_FILE):
+        return []
+    changes = []
+    try:
+        with open(CHANGE_LOG_FILE) as file:
+            for line in file:
+                try:
+                    changes.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A torn last line from an interrupted append
+                    logger.warning("Skipping malformed translation change log line.")
+    except Exception as e:
+        logger.error("Failed to read translation change log: %s", e)
+    return changes
+
+
+def change_log_offset() -> int:
+    """Return the current end of the change log (0 if there is none)."""
+    try:
+        return os.path.getsize(CHANGE_LOG_FILE)
+    except OSError:
+        return 0
+
+
+def compact_translation_cache(
+    translations: dict, fingerprint: list | None = None, log_offset: int = 0
+) -> int:
+    """
+    Write a full snapshot to CACHE_FILE (see `save_translations_to_cache`) and
+    drop the change log entries it already contains.
+    - `log_offset` is the `change_log_offset()` taken before the snapshot was
+      read from the database: entries before it are dropped, later ones are
+      kept. Hold `cache_file_lock()` from taking the offset until this returns,
+      so no other compaction moves the entries in between.
+    Returns the version of the new snapshot (0 if writing it failed, in which
+    case the change log is left untouched).
+    """
+    version = save_translations_to_cache(translations, fingerprint)
+    if not version or not os.path.exists(CHANGE_LOG_FILE):
+        return version
+    try:
+        with open(CHANGE_LOG_FILE, "rb+") as file:
+            fcntl.flock(file, fcntl.LOCK_EX)
+            try:
+                file.seek(log_offset)
+                remaining = file.read()
+                file.seek(0)
+                file.write(remaining)
+                file.truncate()
+            finally:
+                fcntl.flock(file, fcntl.LOCK_UN)
+        logger.info(
+            "Compacted translation change log (%d entries kept).",
+            remaining.count(b"\n"),
+        )
+    except Exception as e:
+        logger.error("Failed to compact translation change log: %s", e)
+    return version
@@ -0,0 +1,157 @@
+import hashlib
+import logging
+import mmap
+import os
+import struct
+from collections.abc import Iterator, Mapping
+
+from app.core.config.settings import settings
+from app.core.utils.cache_utils import write_file_atomically
+
+logger = logging.getLogger(__name__)
+
+COMPILED_CATALOG_FILE = os.path.join(
+    settings.TRANSLATION_CACHE_DIR, "translation_catalog.bin"
+)
+
+# File layout (little-endian), similar in spirit to gettext `.mo` files:
+#   header:   magic, format version, catalog version (matching the JSON cache
+#             file), sha256 of everything after the header, number of languages
+#   index:    per language (code offset, code length, table offset, entries)
+#   tables:   per language, entries sorted by UTF-8 key bytes
+#             (key offset, key length, value offset, value length)
+#   blob:     UTF-8 encoded codes, keys and values
+MAGIC = b"SWTC"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<4sIQ32sI")
+LANGUAGE = struct.Struct("<IIII")
+ENTRY = struct.Struct("<IIII")
+
+
+class CompiledCatalogError(Exception):
+    pass
+
+
+def compile_catalog(
+    translations: Mapping[str, Mapping[str, str]], version: int = 0
+) -> bytes:
+    """Serialize translations into the compiled binary format."""
+    languages = sorted(
+        (code.encode(), sorted((k.encode(), v.encode()) for k, v in values.items()))
+        for code, values in translations.items()
+    )
+    tables_start = HEADER.size + LANGUAGE.size * len(languages)
+    blob_start = tables_start + ENTRY.size * sum(len(e) for _, e in languages)
+
+    index = bytearray()
+    tables = bytearray()
+    blob = bytearray()
+
+    def add_string(data: bytes) -> tuple[int, int]:
+        offset = blob_start + len(blob)
+        blob.extend(data)
+        return offset, len(data)
+
+    for code, entries in languages:
+        table_offset = tables_start + len(tables)
+        index.extend(LANGUAGE.pack(*add_string(code), table_offset, len(entries)))
+        for key, value in entries:
+            tables.extend(ENTRY.pack(*add_string(key), *add_string(value)))
+
+    body = bytes(index + tables + blob)
+    digest = hashlib.sha256(body).digest()
+    return HEADER.pack(MAGIC, FORMAT_VERSION, version, digest, len(languages)) + body
+
+
+def read_catalog_header(path: str) -> tuple[int, bytes] | None:
+    """Return (catalog version, content digest) of a compiled catalog, if readable."""
+    try:
+        with open(path, "rb") as file:
+            magic, format_version, version, digest, _ = HEADER.unpack(
+                file.read(HEADER.size)
+            )
+    except (OSError, struct.error):
+        return None
+    if magic != MAGIC or format_version != FORMAT_VERSION:
+        return None
+    return version, digest
+
+
+def write_compiled_catalog(
+    path: str, translations: Mapping[str, Mapping[str, str]], version: int = 0
+) -> bool:
+    """
+    Atomically write the compiled catalog to `path` (temp file + rename).
+    - Skipped when the file already holds the same version and content, so
+      workers end up mapping the very same file and share its pages.
+    Returns True if the file was (re)written.
+    """
+    data = compile_catalog(translations, version)
+    _, _, _, digest, _ = HEADER.unpack_from(data)
+    if read_catalog_header(path) == (version, digest):
+        return False
+    write_file_atomically(path, data)
+    logger.info("Wrote compiled translation catalog '%s' (version %d).", path, version)
+    return True
+
+
+class CompiledLanguage(Mapping[str, str]):
+    """
+    Read-only view of one language inside a memory-mapped compiled catalog.
+    Lookups binary-search the sorted entry table; nothing is parsed up front.
+    """
+
+    def __init__(self, buffer: mmap.mmap, table_offset: int, size: int) -> None:
+        self._buffer = buffer
+        self._table_offset = table_offset
+        self._size = size
+
+    def _entry(self, index: int) -> tuple[int, int, int, int]:
+        return ENTRY.unpack_from(self._buffer, self._table_offset + index * ENTRY.size)
+
+    def __getitem__(self, key: str) -> str:
+        target = key.encode()
+        low, high = 0, self._size
+        while low < high:
+            middle = (low + high) // 2
+            key_offset, key_length, value_offset, value_length = self._entry(middle)
+            candidate = self._buffer[key_offset : key_offset + key_length]
+            if candidate == target:
+                return self._buffer[value_offset : value_offset + value_length].decode()
+            if candidate < target:
+                low = middle + 1
+            else:
+                high = middle
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._size):
+            key_offset, key_length, _, _ = self._entry(index)
+            yield self._buffer[key_offset : key_offset + key_length].decode()
+
+    def __len__(self) -> int:
+        return self._size
+
+
+def open_compiled_catalog(path: str) -> dict[str, CompiledLanguage]:
+    """
+    Memory-map a compiled catalog and return a view per language.
+    The mapping stays open for as long as any of the views is referenced.
+    """
+    with open(path, "rb") as file:
+        try:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, format_version, _, _, language_count = HEADER.unpack_from(buffer, 0)
+        except (ValueError, struct.error) as e:
+            raise CompiledCatalogError(f"Truncated compiled catalog '{path}'") from e
+    if magic != MAGIC or format_version != FORMAT_VERSION:
+        raise CompiledCatalogError(f"Unsupported compiled catalog '{path}'")
+
+    languages = {}
+    for index in range(language_count):
+        code_offset, code_length, table_offset, size = LANGUAGE.unpack_from(
+            buffer, HEADER.size + index * LANGUAGE.size
+        )
+        code = buffer[code_offset : code_offset + code_length].decode()
+        languages[code] = CompiledLanguage(buffer, table_offset, size)
+    return languages
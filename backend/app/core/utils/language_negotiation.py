@@ -0,0 +1,112 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Set
+
+from app.core.utils.translation_catalog import (
+    DEFAULT_LANGUAGE,
+    TranslationCatalog,
+    catalog,
+)
+
+# Real traffic only carries a few hundred distinct Accept-Language values
+NEGOTIATION_CACHE_SIZE = 1024
+
+
+def parse_accept_language(header: str) -> list[str]:
+    """
+    Return the language ranges of an Accept-Language header ordered by
+    descending q-value (ties keep header order); ranges with q=0 are dropped.
+    """
+    weighted = []
+    for position, item in enumerate(header.split(",")):
+        language_range, _, params = item.partition(";")
+        language_range = language_range.strip()
+        if not language_range:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            weighted.append((-quality, position, language_range))
+    return [language_range for _, _, language_range in sorted(weighted)]
+
+
+def lookup_language(language_ranges: list[str], available: Set[str]) -> str | None:
+    """
+    RFC 4647 "Lookup": for each range in priority order, try the tag and then
+    progressively shorter prefixes of it against the available languages
+    (case-insensitive). Returns the matching catalog code, or None.
+    """
+    codes = {code.lower(): code for code in available}
+    for language_range in language_ranges:
+        if language_range == "*":
+            continue
+        subtags = language_range.replace("_", "-").lower().split("-")
+        while subtags:
+            code = codes.get("-".join(subtags))
+            if code is not None:
+                return code
+            subtags.pop()
+            # A single-character subtag (e.g. "x") never ends a tag
+            if subtags and len(subtags[-1]) == 1:
+                subtags.pop()
+    return None
+
+
+class LanguageNegotiator:
+    """
+    Negotiates Accept-Language headers against the languages in the catalog,
+    memoizing results in a bounded LRU keyed by the raw header.
+    Entries negotiated against a different set of languages are recomputed.
+    """
+
+    def __init__(self, source: TranslationCatalog, max_size: int) -> None:
+        self._source = source
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[frozenset[str], str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def negotiate(self, header: str | None) -> str:
+        """Return the best catalog language for `header`, or the default."""
+        if not header:
+            return DEFAULT_LANGUAGE
+        languages = self._source.language_codes()
+        with self._lock:
+            entry = self._entries.get(header)
+            if entry is not None and (entry[0] is languages or entry[0] == languages):
+                # Re-key on the current set so the next check is an identity test
+                self._entries[header] = (languages, entry[1])
+                self._entries.move_to_end(header)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        language = (
+            lookup_language(parse_accept_language(header), languages)
+            or DEFAULT_LANGUAGE
+        )
+        with self._lock:
+            self._entries[header] = (languages, language)
+            self._entries.move_to_end(header)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return language
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+negotiator = LanguageNegotiator(catalog, max_size=NEGOTIATION_CACHE_SIZE)
@@ -0,0 +1,84 @@
+import gzip
+import hashlib
+import json
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+from app.core.utils.translation_catalog import TranslationCatalog, catalog
+
+
+@dataclass(frozen=True)
+class TranslationBundle:
+    """
+    One language of the catalog, serialized and compressed once.
+    `content_hash` changes exactly when the translations change.
+    """
+
+    language_code: str
+    content_hash: str
+    body: bytes
+    gzipped: bytes
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.content_hash}"'
+
+    @property
+    def gzip_etag(self) -> str:
+        # Each encoding is a different representation, so it needs its own tag
+        return f'"{self.content_hash}-gzip"'
+
+
+def build_bundle(
+    language_code: str, translations: Mapping[str, str]
+) -> TranslationBundle:
+    body = json.dumps(
+        dict(translations), ensure_ascii=False, sort_keys=True, separators=(",", ":")
+    ).encode()
+    return TranslationBundle(
+        language_code=language_code,
+        content_hash=hashlib.sha256(body).hexdigest()[:20],
+        body=body,
+        gzipped=gzip.compress(body, compresslevel=9, mtime=0),
+    )
+
+
+class TranslationBundleCache:
+    """
+    Per-process cache of pre-serialized bundles.
+    The catalog replaces a language's mapping on every change, so a bundle is
+    rebuilt only when the mapping it was built from is no longer current.
+    """
+
+    def __init__(self, source: TranslationCatalog) -> None:
+        self._source = source
+        self._bundles: dict[str, tuple[Mapping[str, str], TranslationBundle]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, language_code: str) -> TranslationBundle | None:
+        translations = self._source.get_language(language_code)
+        if not translations:
+            return None
+        cached = self._bundles.get(language_code)
+        if cached is not None and cached[0] is translations:
+            return cached[1]
+        bundle = build_bundle(language_code, translations)
+        with self._lock:
+            self._bundles[language_code] = (translations, bundle)
+            # Do not keep languages alive that the catalog has evicted
+            for code in list(self._bundles):
+                if not self._source.is_resident(code):
+                    del self._bundles[code]
+        return bundle
+
+
+def etag_matches(if_none_match: str | None, *etags: str) -> bool:
+    """Weak comparison of an If-None-Match header against the given tags."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or any(etag in candidates for etag in etags)
+
+
+bundles = TranslationBundleCache(catalog)
@@ -0,0 +1,418 @@
+import itertools
+import logging
+import sys
+import threading
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from typing import Any
+
+from app.core.config.settings import settings
+from app.core.utils.cache_utils import (
+    cache_file_stat,
+    load_versioned_translations_from_cache,
+    read_cache_header,
+    read_cache_version,
+    read_translation_changes,
+)
+from app.core.utils.compiled_catalog import (
+    COMPILED_CATALOG_FILE,
+    CompiledCatalogError,
+    CompiledLanguage,
+    open_compiled_catalog,
+    read_catalog_header,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LANGUAGE = "en"
+
+# Distinct requested locales whose fallback chain is memoized per snapshot
+MAX_CACHED_LOCALES = 1024
+
+
+class TranslationCatalog:
+    """
+    Per-process, read-mostly store of translations keyed by language code.
+
+    Readers never take a lock: every write builds new dictionaries and swaps
+    the reference, so a request always sees a complete, consistent snapshot.
+    Languages are either plain dicts or read-only views into a memory-mapped
+    compiled catalog; an edited language is copied into a dict.
+
+    Locales resolve along a fallback chain (e.g. cs-CZ -> cs -> en) into a
+    read-only overlay of the chain's languages, built once per snapshot. The
+    overlay copies nothing, so mapped languages stay shared between workers
+    and merged locales cost no memory outside the budget.
+
+    With a `max_bytes` budget, languages held as dicts count against it and
+    the least recently used ones (never the default language) are evicted;
+    `ensure_loaded` brings a known language back through `loader`. Mapped
+    languages live in the shared page cache and cost nothing.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 0,
+        loader: Callable[[str], dict[str, str]] | None = None,
+    ) -> None:
+        # (translations, locale views) are swapped together, so cached views
+        # always belong to the translations they were built from
+        self._state: tuple[dict[str, Mapping[str, str]], _LocaleViews] = (
+            {},
+            _LocaleViews(),
+        )
+        self._write_lock = threading.Lock()
+        # Version and stat of the cache file the catalog was last loaded from
+        self.version = 0
+        self._cache_stat: tuple[int, int, int] | None = None
+        # Database fingerprint recorded in that cache file, if any
+        self.fingerprint: list | None = None
+        self.max_bytes = max_bytes
+        self.loader = loader
+        # Languages that exist but need not be resident (e.g. evicted ones)
+        self._known: frozenset[str] = frozenset()
+        self._sizes: dict[str, int] = {}
+        self._last_used: dict[str, int] = {}
+        self._clock = itertools.count()
+        self.loads = 0
+        self.evictions = 0
+
+    @property
+    def _translations(self) -> dict[str, Mapping[str, str]]:
+        return self._state[0]
+
+    @_translations.setter
+    def _translations(self, translations: dict[str, Mapping[str, str]]) -> None:
+        self._state = (translations, _LocaleViews())
+
+    def load(self) -> None:
+        """
+        Populate the catalog from the on-disk cache files and replay the change
+        log written since.
+        - The compiled catalog is memory-mapped when it holds the same version
+          as the JSON cache file, which then is not parsed at all.
+        """
+        cache_stat = cache_file_stat()
+        cache_header = read_cache_header()
+        version = cache_header["version"]
+        header = read_catalog_header(COMPILED_CATALOG_FILE)
+        loaded = False
+        if version and header is not None and header[0] == version:
+            try:
+                self.load_compiled(COMPILED_CATALOG_FILE)
+                loaded = True
+            except (OSError, CompiledCatalogError) as e:
+                logger.error("Failed to map compiled translation catalog: %s", e)
+        if not loaded:
+            loaded_version, translations = load_versioned_translations_from_cache()
+            self.replace(translations)
+            if loaded_version != version:
+                # Replaced in between; its fingerprint is unknown
+                version, cache_header = loaded_version, {}
+        self.apply_changes(read_translation_changes())
+        self.version = version
+        self.fingerprint = cache_header.get("fingerprint")
+        self._cache_stat = cache_stat
+
+    def reload_if_changed(self) -> bool:
+        """
+        Reload from disk only if another process wrote a new catalog version.
+        An unchanged file costs a single stat() call.
+        """
+        cache_stat = cache_file_stat()
+        if cache_stat is None or cache_stat == self._cache_stat:
+            return False
+        if read_cache_version() == self.version:
+            self._cache_stat = cache_stat
+            return False
+        self.load()
+        return True
+
+    def load_compiled(self, path: str) -> None:
+        """Swap in the languages of a memory-mapped compiled catalog."""
+        languages = open_compiled_catalog(path)
+        with self._write_lock:
+            self._swap(languages)
+        logger.info(
+            "Translation catalog mapped from '%s' (%d languages).", path, len(languages)
+        )
+
+    def replace(self, translations: dict[str, dict[str, str]]) -> None:
+        """Atomically swap in a complete set of translations."""
+        snapshot = {lang: dict(values) for lang, values in translations.items()}
+        with self._write_lock:
+            self._swap(snapshot)
+        logger.info("Translation catalog replaced (%d languages).", len(snapshot))
+
+    def replace_languages(self, translations: dict[str, dict[str, str]]) -> None:
+        """Atomically swap in complete translations for some languages only."""
+        with self._write_lock:
+            updated = dict(self._translations)
+            updated.update(translations)
+            self._swap(updated, translations)
+        logger.info("Translations replaced for languages: %s", sorted(translations))
+
+    def set(self, language_code: str, key: str, value: str) -> None:
+        """Add or update a single translation."""
+        self.apply_changes(
+            [{"op": "set", "language_code": language_code, "key": key, "value": value}]
+        )
+
+    def update(self, translations: dict[str, dict[str, str]]) -> None:
+        """Add or update many translations with a single swap."""
+        self.apply_changes(
+            [
+                {
+                    "op": "set",
+                    "language_code": language_code,
+                    "key": key,
+                    "value": value,
+                }
+                for language_code, values in translations.items()
+                for key, value in values.items()
+            ]
+        )
+
+    def apply_changes(self, changes: list[dict[str, str]]) -> None:
+        """
+        Apply "set"/"delete" change records, in order, with a single swap.
+        Changes to known languages that are not resident are skipped; they
+        are loaded in full, including the change, on next use.
+        """
+        if not changes:
+            return
+        with self._write_lock:
+            updated = dict(self._translations)
+            copied = set()
+            for change in changes:
+                language_code = change["language_code"]
+                if language_code not in copied:
+                    if language_code not in updated and language_code in self._known:
+                        continue
+                    updated[language_code] = dict(updated.get(language_code, {}))
+                    copied.add(language_code)
+                if change["op"] == "set":
+                    updated[language_code][change["key"]] = change["value"]
+                else:
+                    updated[language_code].pop(change["key"], None)
+            self._swap(updated, copied)
+
+    def remove(self, language_code: str, key: str) -> None:
+        """Remove a single translation if present."""
+        if key in self._translations.get(language_code, {}):
+            self.apply_changes(
+                [{"op": "delete", "language_code": language_code, "key": key}]
+            )
+
+    def set_known_languages(self, language_codes: Iterable[str]) -> None:
+        """Record every language that exists, resident or not."""
+        with self._write_lock:
+            self._known = frozenset(language_codes)
+            self._swap(dict(self._translations), ())
+
+    def is_resident(self, language_code: str) -> bool:
+        return language_code in self._translations
+
+    def missing_languages(self, locale: str) -> list[str]:
+        """Return the languages of the fallback chain of `locale` not resident."""
+        translations, views = self._state
+        return [code for code in self._chain(locale, views) if code not in translations]
+
+    def ensure_loaded(self, *language_codes: str) -> None:
+        """
+        Load known languages that are not resident through `loader`.
+        Blocking: call it from a worker thread, never from the event loop.
+        """
+        if self.loader is None:
+            return
+        known = self.language_codes()
+        loaded = {
+            code: self.loader(code)
+            for code in language_codes
+            if code in known and code not in self._translations
+        }
+        if not loaded:
+            return
+        with self._write_lock:
+            updated = dict(self._translations)
+            added = [code for code in loaded if code not in updated]
+            for code in added:
+                updated[code] = loaded[code]
+            self.loads += len(added)
+            self._swap(updated, added)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "languages": len(self.language_codes()),
+            "resident_languages": len(self._translations),
+            "resident_bytes": sum(self._sizes.values()),
+            "max_bytes": self.max_bytes,
+            "loads": self.loads,
+            "evictions": self.evictions,
+        }
+
+    def _swap(
+        self,
+        translations: dict[str, Mapping[str, str]],
+        changed: Iterable[str] | None = None,
+    ) -> None:
+        """
+        Install `translations` as the new snapshot (write lock held).
+        `changed` lists the languages that differ from the current snapshot;
+        None means all of them.
+        """
+        if changed is None:
+            self._sizes = {}
+            changed = translations
+        for code in list(self._sizes):
+            if code not in translations:
+                del self._sizes[code]
+        for code in changed:
+            self._sizes[code] = _estimate_size(translations[code])
+            self._last_used[code] = next(self._clock)
+        if self.max_bytes > 0:
+            self._evict(translations)
+        self._translations = translations
+
+    def _evict(self, translations: dict[str, Mapping[str, str]]) -> None:
+        """Drop least recently used languages until within the budget."""
+        total = sum(self._sizes.values())
+        if total <= self.max_bytes:
+            return
+        candidates = sorted(
+            (
+                code
+                for code, size in self._sizes.items()
+                if size and code != DEFAULT_LANGUAGE
+            ),
+            key=lambda code: self._last_used.get(code, -1),
+        )
+        evicted = []
+        for code in candidates:
+            if total <= self.max_bytes:
+                break
+            total -= self._sizes.pop(code)
+            del translations[code]
+            evicted.append(code)
+        if evicted:
+            self._known = self._known | set(evicted)
+            self.evictions += len(evicted)
+            logger.info("Evicted translations for languages: %s", evicted)
+
+    def get_language(self, language_code: str) -> Mapping[str, str]:
+        """Return the translations for a language (empty dict if not resident)."""
+        language = self._translations.get(language_code)
+        if language is None:
+            return {}
+        self._last_used[language_code] = next(self._clock)
+        return language
+
+    def language_codes(self) -> frozenset[str]:
+        """Return the codes of all known languages, resident or not."""
+        translations, views = self._state
+        if views.language_codes is None:
+            views.language_codes = frozenset(translations) | self._known
+        return views.language_codes
+
+    def get_locale(self, locale: str) -> Mapping[str, str]:
+        """
+        Return the translations for `locale` merged along its fallback chain:
+        the full tag, its shorter prefixes, then the default language.
+        """
+        translations, views = self._state
+        chain = self._chain(locale, views)
+        for language_code in chain:
+            self._last_used[language_code] = next(self._clock)
+        merged = views.merged.get(chain)
+        if merged is None:
+            # Languages that are not resident (see `ensure_loaded`) are skipped
+            resident = [translations[code] for code in chain if code in translations]
+            if len(resident) > 1:
+                merged = LocaleOverlay(tuple(resident))
+            else:
+                merged = resident[0] if resident else {}
+            if len(resident) == len(chain):
+                views.merged[chain] = merged
+        return merged
+
+    def _chain(self, locale: str, views: "_LocaleViews") -> tuple[str, ...]:
+        chain = views.chains.get(locale)
+        if chain is None:
+            chain = fallback_chain(locale, self.language_codes())
+            if len(views.chains) < MAX_CACHED_LOCALES:
+                views.chains[locale] = chain
+        return chain
+
+    def snapshot(self) -> dict[str, Mapping[str, str]]:
+        """Return the current translations for all languages."""
+        return self._translations
+
+
+class _LocaleViews:
+    """Language codes, fallback chains and merged mappings of one snapshot."""
+
+    def __init__(self) -> None:
+        self.language_codes: frozenset[str] | None = None
+        self.chains: dict[str, tuple[str, ...]] = {}
+        self.merged: dict[tuple[str, ...], Mapping[str, str]] = {}
+
+
+class LocaleOverlay(Mapping[str, str]):
+    """
+    Read-only view of several languages, the first one holding a key wins.
+    A lookup costs one dict hit per language of the chain (at most a few).
+    """
+
+    __slots__ = ("_languages",)
+
+    def __init__(self, languages: tuple[Mapping[str, str], ...]) -> None:
+        self._languages = languages
+
+    def __getitem__(self, key: str) -> str:
+        for language in self._languages:
+            value = language.get(key)
+            if value is not None:
+                return value
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        for language in self._languages:
+            value = language.get(key)
+            if value is not None:
+                return value
+        return default
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(dict.fromkeys(itertools.chain.from_iterable(self._languages)))
+
+    def __len__(self) -> int:
+        return len(set().union(*self._languages))
+
+
+def _estimate_size(language: Mapping[str, str]) -> int:
+    """Approximate heap bytes held by a language; mapped ones cost nothing."""
+    if isinstance(language, CompiledLanguage):
+        return 0
+    return sys.getsizeof(language) + sum(
+        sys.getsizeof(key) + sys.getsizeof(value) for key, value in language.items()
+    )
+
+
+def fallback_chain(locale: str, language_codes: Iterable[str]) -> tuple[str, ...]:
+    """
+    Return the catalog languages to consult for `locale`, most specific first,
+    e.g. ("cs-CZ", "cs", "en"); tags are matched case-insensitively.
+    """
+    codes = {code.lower(): code for code in language_codes}
+    subtags = locale.strip().replace("_", "-").lower().split("-")
+    candidates = ["-".join(subtags[:size]) for size in range(len(subtags), 0, -1)]
+    candidates.append(DEFAULT_LANGUAGE)
+
+    chain: list[str] = []
+    for candidate in candidates:
+        code = codes.get(candidate)
+        if code is not None and code not in chain:
+            chain.append(code)
+    return tuple(chain)
+
+
+catalog = TranslationCatalog(max_bytes=settings.TRANSLATION_CATALOG_MAX_BYTES)
@@ -0,0 +1,64 @@
+import csv
+import io
+import json
+import zlib
+from collections.abc import Iterable, Iterator
+from typing import Literal
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+CSV_HEADER = ("language_code", "key", "value")
+
+Row = tuple[str, str, str]
+
+
+def encode_ndjson(batches: Iterable[Iterable[Row]]) -> Iterator[bytes]:
+    """One JSON object per line, one chunk per batch of rows."""
+    for rows in batches:
+        chunk = "".join(
+            json.dumps(
+                {"language_code": language_code, "key": key, "value": value},
+                ensure_ascii=False,
+            )
+            + "\n"
+            for language_code, key, value in rows
+        )
+        if chunk:
+            yield chunk.encode()
+
+
+def encode_csv(batches: Iterable[Iterable[Row]]) -> Iterator[bytes]:
+    """RFC 4180 CSV with a header row, one chunk per batch of rows."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\r\n")
+    writer.writerow(CSV_HEADER)
+    for rows in batches:
+        writer.writerows(rows)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Compress a byte stream incrementally into a single gzip member."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def encode_translations(
+    batches: Iterable[Iterable[Row]], export_format: ExportFormat, compress: bool
+) -> Iterator[bytes]:
+    encoder = encode_csv if export_format == "csv" else encode_ndjson
+    chunks = encoder(batches)
+    return gzip_chunks(chunks) if compress else chunks
@@ -1,22 +1,18 @@
 from fastapi import Request
 
-from app.core.utils.cache_utils import load_translations_from_cache
+from app.core.utils.translation_catalog import DEFAULT_LANGUAGE, catalog
 
 
 def translate(request: Request, key: str, **kwargs) -> str:
     """
-    Look up the translation for a given key from request.state.translations.
-    If not found, fall back to the default language ('en') translations; otherwise, return the key.
+    Look up the translation for a given key from request.state.translations,
+    which already includes the fallback languages ('en' last); otherwise, return the key.
     """
     # Try to get current translations from the request state
-    translations = getattr(request.state, "translations", {})
-    text = translations.get(key)
-
-    if text is None:
-        # Fallback: load default translations for 'en' from the cache
-        all_translations = load_translations_from_cache()
-
-        default_translations = all_translations.get("en", {})
-        text = default_translations.get(key, key)
+    translations = getattr(request.state, "translations", None)
+    if translations is None:
+        # Request did not pass through LanguageMiddleware
+        translations = catalog.get_locale(DEFAULT_LANGUAGE)
+    text = translations.get(key, key)
 
     return text.format(**kwargs) if kwargs else text
@@ -0,0 +1,34 @@
+from collections.abc import AsyncIterable, AsyncIterator
+
+# Longest accepted NDJSON line; a translation row is far below this
+MAX_LINE_BYTES = 64 * 1024
+
+
+async def iter_ndjson_lines(
+    chunks: AsyncIterable[bytes], max_line_bytes: int = MAX_LINE_BYTES
+) -> AsyncIterator[tuple[int, bytes | None]]:
+    """
+    Split a byte stream into (line_number, line) pairs without buffering more
+    than one line. Lines longer than `max_line_bytes` are discarded and
+    yielded as None, so a malformed body cannot exhaust memory.
+    """
+    buffer = b""
+    line_number = 0
+    oversized = False
+    async for chunk in chunks:
+        buffer += chunk
+        lines = buffer.split(b"\n")
+        buffer = lines.pop()
+        for line in lines:
+            line_number += 1
+            if oversized or len(line) > max_line_bytes:
+                oversized = False
+                yield line_number, None
+            else:
+                yield line_number, line
+        if len(buffer) > max_line_bytes:
+            # Drop the rest of this line as it arrives
+            oversized = True
+            buffer = b""
+    if buffer or oversized:
+        yield line_number + 1, None if oversized else buffer
@@ -1,34 +1,433 @@
+import json
+import uuid
+from collections.abc import Iterable
+
+from sqlalchemy import func, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import load_only
 from sqlmodel import Session, select
 
-from app.models.translation import Translation
+from app.models.translation import Translation, TranslationChange
+
+# Rows per INSERT statement, keeps bind parameters well below Postgres' limit
+BULK_INSERT_BATCH_SIZE = 1000
+
+# Postgres channel on which every translation write is announced to all workers
+TRANSLATION_CHANGES_CHANNEL = "translation_changes"
+
+# Above this many changed rows one "reload" notification per language is sent
+NOTIFY_MAX_CHANGES = 100
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+NOTIFY_MAX_PAYLOAD_BYTES = 7900
+
+# Transaction-level advisory lock that serializes history appends until commit
+TRANSLATION_HISTORY_LOCK_ID = 0x7472616E  # "tran"
+
+# Rows fetched per round trip when streaming the table through a server-side cursor
+EXPORT_BATCH_SIZE = 1000
+
+
+def notify_translation_changes(db: Session, changes: list[dict[str, str]]) -> None:
+    """
+    Queue one NOTIFY per change on `TRANSLATION_CHANGES_CHANNEL`.
+    Postgres delivers them only when the surrounding transaction commits, so
+    listeners never see a change that was rolled back.
+    - Large batches are announced as one "reload" per affected language, and
+      as a single full "reload" if even those are too many.
+    """
+    if not changes:
+        return
+    payloads = [json.dumps(change) for change in changes]
+    if len(payloads) > NOTIFY_MAX_CHANGES or any(
+        len(payload) > NOTIFY_MAX_PAYLOAD_BYTES for payload in payloads
+    ):
+        payloads = _reload_payloads(change["language_code"] for change in changes)
+    _notify(db, payloads)
+
+
+def notify_translation_reload(db: Session, language_codes: Iterable[str]) -> None:
+    """Queue one "reload" notification per language, or a single full one."""
+    _notify(db, _reload_payloads(language_codes))
+
+
+def _reload_payloads(language_codes: Iterable[str]) -> list[str]:
+    language_codes = dict.fromkeys(language_codes)
+    if len(language_codes) > NOTIFY_MAX_CHANGES:
+        return [json.dumps({"op": "reload"})]
+    return [
+        json.dumps({"op": "reload", "language_code": language_code})
+        for language_code in language_codes
+    ]
+
+
+def _notify(db: Session, payloads: list[str]) -> None:
+    db.execute(
+        text(
+            "SELECT pg_notify(:channel, payload) "
+            "FROM unnest(CAST(:payloads AS text[])) AS payload"
+        ),
+        {
+            "channel": TRANSLATION_CHANGES_CHANNEL,
+            "payloads": payloads,
+        },
+    )
+
+
+def record_translation_changes(
+    db: Session, changes: list[dict[str, str]], notify: bool = True
+) -> None:
+    """
+    Append the changes to the translation history and announce them to all
+    workers, both as part of the caller's transaction.
+    - Without `notify` the caller announces them itself, e.g. once for many
+      transactions.
+    - History ids are the versions clients sync from, so they must become
+      visible in id order: the advisory lock, held until the caller commits,
+      keeps a later id from committing before an earlier one.
+    """
+    if not changes:
+        return
+    _lock_history(db)
+    for start in range(0, len(changes), BULK_INSERT_BATCH_SIZE):
+        db.execute(
+            insert(TranslationChange).values(
+                [
+                    {
+                        "language_code": change["language_code"],
+                        "key": change["key"],
+                        "value": change.get("value"),
+                    }
+                    for change in changes[start : start + BULK_INSERT_BATCH_SIZE]
+                ]
+            )
+        )
+    if notify:
+        notify_translation_changes(db, changes)
+
+
+def _lock_history(db: Session) -> None:
+    db.execute(
+        text("SELECT pg_advisory_xact_lock(:lock_id)"),
+        {"lock_id": TRANSLATION_HISTORY_LOCK_ID},
+    )
+
+
+def _set_change(translation: Translation) -> dict[str, str]:
+    return {
+        "op": "set",
+        "language_code": translation.language_code,
+        "key": translation.key,
+        "value": translation.value,
+    }
 
 
 def create_translation(db: Session, translation: Translation):
     db.add(translation)
+    record_translation_changes(db, [_set_change(translation)])
     db.commit()
     db.refresh(translation)
     return translation
 
 
+def bulk_create_translations(
+    db: Session, translations: list[dict[str, str]]
+) -> list[tuple[str, str]]:
+    """
+    Insert many translations in one transaction with multi-row
+    `INSERT ... ON CONFLICT (language_code, key) DO NOTHING` statements.
+    Returns the (language_code, key) pairs that were actually inserted.
+    """
+    inserted: list[tuple[str, str]] = []
+    changes: list[dict[str, str]] = []
+    for start in range(0, len(translations), BULK_INSERT_BATCH_SIZE):
+        batch = translations[start : start + BULK_INSERT_BATCH_SIZE]
+        statement = (
+            insert(Translation)
+            .values([{"id": uuid.uuid4(), **row} for row in batch])
+            .on_conflict_do_nothing(index_elements=["language_code", "key"])
+            .returning(Translation.language_code, Translation.key, Translation.value)
+        )
+        for language_code, key, value in db.execute(statement):
+            inserted.append((language_code, key))
+            changes.append(
+                {
+                    "op": "set",
+                    "language_code": language_code,
+                    "key": key,
+                    "value": value,
+                }
+            )
+    record_translation_changes(db, changes)
+    db.commit()
+    return inserted
+
+
+def upsert_translations(
+    db: Session, translations: list[dict[str, str]], notify: bool = True
+) -> list[dict[str, str]]:
+    """
+    Insert or update many translations in one transaction with
+    `INSERT ... ON CONFLICT (language_code, key) DO UPDATE` statements.
+    Rows whose value is unchanged are not touched. When a pair repeats, the
+    last occurrence wins. Returns the "set" changes that were applied.
+    - `notify` as in `record_translation_changes`.
+    """
+    rows = {(row["language_code"], row["key"]): row for row in translations}
+    rows = list(rows.values())
+    changes: list[dict[str, str]] = []
+    for start in range(0, len(rows), BULK_INSERT_BATCH_SIZE):
+        batch = rows[start : start + BULK_INSERT_BATCH_SIZE]
+        statement = insert(Translation).values(
+            [{"id": uuid.uuid4(), **row} for row in batch]
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=["language_code", "key"],
+            set_={"value": statement.excluded.value, "updated_at": func.now()},
+            where=Translation.value.is_distinct_from(statement.excluded.value),
+        ).returning(Translation.language_code, Translation.key, Translation.value)
+        for language_code, key, value in db.execute(statement):
+            changes.append(
+                {
+                    "op": "set",
+                    "language_code": language_code,
+                    "key": key,
+                    "value": value,
+                }
+            )
+    record_translation_changes(db, changes, notify)
+    db.commit()
+    return changes
+
+
+def copy_translations(
+    db: Session, rows: Iterable[tuple[str, str, str]]
+) -> dict[str, int]:
+    """
+    Load (language_code, key, value) rows with `COPY ... FROM STDIN` into a
+    temporary staging table, then merge them in a single upsert statement.
+    Much faster than row-by-row inserts for whole locale packs. When a pair
+    repeats, the last row wins.
+    - The same statement appends the history, so changed rows never travel
+      back to Python; workers get one "reload" per changed language.
+    Returns the number of changed rows per language.
+    """
+    cursor = db.connection().connection.driver_connection.cursor()
+    with cursor:
+        cursor.execute(
+            "CREATE TEMPORARY TABLE translation_staging "
+            "(position bigserial, language_code text, key text, value text) "
+            "ON COMMIT DROP"
+        )
+        with cursor.copy(
+            "COPY translation_staging (language_code, key, value) FROM STDIN"
+        ) as copy:
+            for row in rows:
+                copy.write_row(row)
+
+    _lock_history(db)
+    changed = dict(
+        db.execute(
+            text(
+                """
+                WITH merged AS (
+                    INSERT INTO translation (id, language_code, key, value)
+                    SELECT DISTINCT ON (language_code, key)
+                           uuid_generate_v4(), language_code, key, value
+                    FROM translation_staging
+                    ORDER BY language_code, key, position DESC
+                    ON CONFLICT (language_code, key) DO UPDATE
+                    SET value = EXCLUDED.value, updated_at = now()
+                    WHERE translation.value IS DISTINCT FROM EXCLUDED.value
+                    RETURNING language_code, key, value
+                ), history AS (
+                    INSERT INTO translationchange (language_code, key, value)
+                    SELECT language_code, key, value FROM merged
+                )
+                SELECT language_code, count(*) FROM merged GROUP BY language_code
+                """
+            )
+        ).all()
+    )
+    if changed:
+        notify_translation_reload(db, sorted(changed))
+    db.commit()
+    return changed
+
+
+# Columns readers need; `value` is fetched from the heap after an index scan
+# on ix_translation_language_code_key
+_TRANSLATION_COLUMNS = load_only(
+    Translation.id, Translation.language_code, Translation.key, Translation.value
+)
+
+
 def get_translations_by_language(db: Session, language_code: str):
     return db.exec(
-        select(Translation).where(Translation.language_code == language_code)
+        select(Translation)
+        .options(_TRANSLATION_COLUMNS)
+        .where(Translation.language_code == language_code)
     ).all()
 
 
-def get_translation_by_key(db: Session, language_code: str, key: str):
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _translation_listing(
+    language_code: str, prefix: str | None = None, search: str | None = None
+):
+    statement = select(Translation).where(Translation.language_code == language_code)
+    if prefix:
+        # The range condition lets the (language_code, key) index bound the scan
+        statement = statement.where(
+            Translation.key >= prefix,
+            Translation.key.like(_escape_like(prefix) + "%", escape="\\"),
+        )
+    if search:
+        # Served by the trigram indexes on key and value
+        pattern = "%" + _escape_like(search) + "%"
+        statement = statement.where(
+            Translation.key.ilike(pattern, escape="\\")
+            | Translation.value.ilike(pattern, escape="\\")
+        )
+    return statement
+
+
+def get_translations_page(
+    db: Session,
+    language_code: str,
+    limit: int,
+    after: str | None = None,
+    prefix: str | None = None,
+    search: str | None = None,
+) -> list[Translation]:
+    """
+    Return up to `limit` translations of a language ordered by key, starting
+    after the key `after` (keyset pagination).
+    """
+    statement = _translation_listing(language_code, prefix, search)
+    if after is not None:
+        statement = statement.where(Translation.key > after)
+    return db.exec(
+        statement.options(_TRANSLATION_COLUMNS).order_by(Translation.key).limit(limit)
+    ).all()
+
+
+def estimate_translations_count(
+    db: Session,
+    language_code: str,
+    prefix: str | None = None,
+    search: str | None = None,
+) -> int:
+    """
+    Planner estimate of the rows matching a listing, from table statistics
+    (`pg_class.reltuples` and column stats) instead of a `count(*)` scan.
+    """
+    connection = db.connection()
+    compiled = _translation_listing(language_code, prefix, search).compile(
+        dialect=connection.dialect
+    )
+    plan = connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+    ).scalar()
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def get_translation_values(db: Session, language_codes: list[str]):
+    """
+    Return (language_code, key, value) rows for the given languages in one
+    query, without hydrating `Translation` objects.
+    """
     return db.exec(
-        select(Translation).where(
-            Translation.language_code == language_code, Translation.key == key
+        select(Translation.language_code, Translation.key, Translation.value).where(
+            Translation.language_code.in_(language_codes)
         )
+    ).all()
+
+
+def iter_translation_values(
+    db: Session,
+    language_codes: list[str] | None = None,
+    batch_size: int = EXPORT_BATCH_SIZE,
+):
+    """
+    Yield batches of (language_code, key, value) rows in index order from a
+    server-side cursor, so memory stays constant regardless of table size.
+    """
+    statement = select(
+        Translation.language_code, Translation.key, Translation.value
+    ).order_by(Translation.language_code, Translation.key)
+    if language_codes:
+        statement = statement.where(Translation.language_code.in_(language_codes))
+    result = db.execute(statement.execution_options(yield_per=batch_size))
+    yield from result.partitions()
+
+
+def get_language_codes(db: Session) -> list[str]:
+    return list(db.exec(select(Translation.language_code).distinct()).all())
+
+
+def get_translation_fingerprint(db: Session) -> tuple:
+    """
+    Return a cheap (row count, latest updated_at) marker of the whole table.
+    Inserts and updates move the latest updated_at, deletes the row count.
+    """
+    return tuple(db.exec(select(func.count(), func.max(Translation.updated_at))).one())
+
+
+def get_latest_change_id(db: Session, language_code: str) -> int:
+    return (
+        db.exec(
+            select(func.max(TranslationChange.id)).where(
+                TranslationChange.language_code == language_code
+            )
+        ).one()
+        or 0
+    )
+
+
+def get_translation_changes(
+    db: Session, language_code: str, since: int, until: int
+) -> list[tuple[str, str | None]]:
+    """
+    Return the latest (key, value) of every key changed in (since, until];
+    value is None for deleted keys.
+    """
+    return db.exec(
+        select(TranslationChange.key, TranslationChange.value)
+        .where(
+            TranslationChange.language_code == language_code,
+            TranslationChange.id > since,
+            TranslationChange.id <= until,
+        )
+        .order_by(TranslationChange.key, TranslationChange.id.desc())
+        .distinct(TranslationChange.key)
+    ).all()
+
+
+def get_translation_by_key(db: Session, language_code: str, key: str):
+    return db.exec(
+        select(Translation)
+        .options(_TRANSLATION_COLUMNS)
+        .where(Translation.language_code == language_code, Translation.key == key)
     ).first()
 
 
+def get_translation(db: Session, translation_id: str):
+    return db.get(Translation, translation_id)
+
+
 def update_translation(db: Session, translation_id: str, translation_data: dict):
     translation = db.get(Translation, translation_id)
+    previous = {"language_code": translation.language_code, "key": translation.key}
     for key, value in translation_data.items():
         setattr(translation, key, value)
     db.add(translation)
+    changes = [_set_change(translation)]
+    if previous != {"language_code": translation.language_code, "key": translation.key}:
+        changes.insert(0, {"op": "delete", **previous})
+    record_translation_changes(db, changes)
     db.commit()
     db.refresh(translation)
     return translation
@@ -37,4 +436,15 @@ def update_translation(db: Session, translation_id: str, translation_data: dict)
 def delete_translation(db: Session, translation_id: str):
     translation = db.get(Translation, translation_id)
     db.delete(translation)
+    record_translation_changes(
+        db,
+        [
+            {
+                "op": "delete",
+                "language_code": translation.language_code,
+                "key": translation.key,
+            }
+        ],
+    )
     db.commit()
+    return translation
@@ -3,6 +3,7 @@ from typing import Any
 from sqlmodel import Session, select
 
 from app.core.security.password_security import get_password_hash, verify_password
+from app.core.security.user_cache import user_cache
 from app.models.user import User, UserCreate, UserUpdate
 
 
@@ -48,6 +49,7 @@ def update_user(*, session: Session, db_user: User, user_in: UserUpdate) -> Any:
     db_user.sqlmodel_update(user_data, update=extra_data)
     session.add(db_user)
     session.commit()
+    user_cache.invalidate(user_id=db_user.id)
     session.refresh(db_user)
     return db_user
 
@@ -12,6 +12,9 @@ from app.core.middleware.cors import setup_cors
 from app.core.middleware.language import setup_language_middleware
 from app.core.middleware.sentry import setup_sentry
 from app.core.middleware.session import setup_session
+from app.core.security.password_hashing import hashing_executor
+from app.core.utils.translation_catalog import catalog
+from app.services.translation_service import load_language
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -29,6 +32,14 @@ async def lifespan(app: FastAPI):  # noqa
     setup_database()
     logger.info("Database initialization complete.")
 
+    # Startup: Create the password hashing pool before the first login
+    hashing_executor.start()
+
+    # Startup: Load translations into the in-process catalog; languages evicted
+    # under TRANSLATION_CATALOG_MAX_BYTES are reloaded from the database
+    catalog.loader = load_language
+    catalog.load()
+
     # Startup: Start background tasks (e.g. cache refresh)
     logger.info("Starting cache refresh background task.")
     start_cache_refresh()
@@ -38,6 +49,7 @@ async def lifespan(app: FastAPI):  # noqa
 
     # Shutdown logic here (if needed)
     logger.info("Shutting down application...")
+    hashing_executor.shutdown()
 
 
 # Create the app using the lifespan context manager
@@ -1,3 +1,5 @@
+import uuid
+
 from pydantic import Field
 from sqlmodel import SQLModel
 
@@ -11,6 +13,9 @@ class Token(SQLModel):
 class TokenPayload(SQLModel):
     sub: str  # User email or user ID
     auth_provider: str = "local"  # 'local', 'google', 'facebook'
+    # Optional identity claims, present in tokens issued for a known user
+    user_id: uuid.UUID | None = None
+    preferred_language: str | None = None
 
 
 class TokenRefreshRequest(SQLModel):
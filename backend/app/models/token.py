@@ -9,10 +9,11 @@ class RefreshToken(SQLModel, table=True):
     Stores refresh tokens linked to users.
     - Each user has **only one refresh token** at a time.
     - Refresh token is updated instead of creating new entries.
+    - Only the SHA-256 hex digest of the token is stored, under a unique index.
     """
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    user_email: str = Field(index=True)
-    token: str = Field(..., nullable=False)  # Mark token as required
+    user_email: str = Field(index=True, unique=True)
+    token_hash: str = Field(..., nullable=False, unique=True, index=True, max_length=64)
     expires_at: datetime = Field(nullable=False)
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
@@ -1,16 +1,80 @@
 import uuid
+from datetime import datetime, timezone
 
+from sqlalchemy import Column, DateTime, Index, func
 from sqlmodel import Field, SQLModel
 
 
 class TranslationBase(SQLModel):
-    language_code: str = Field(max_length=5, index=True)  # e.g., 'en', 'cs'
-    key: str = Field(max_length=255, index=True)  # e.g., 'welcome_message'
+    language_code: str = Field(max_length=5)  # e.g., 'en', 'cs'
+    key: str = Field(max_length=255)  # e.g., 'welcome_message'
     value: str = Field(max_length=1000)  # Translated text
 
 
 class Translation(TranslationBase, table=True):
+    __table_args__ = (
+        # One row per (language_code, key). `id` is carried in the index;
+        # `value` is not, since a 1000-character value can exceed the btree
+        # tuple size limit
+        Index(
+            "ix_translation_language_code_key",
+            "language_code",
+            "key",
+            unique=True,
+            postgresql_include=["id"],
+        ),
+        # Trigram indexes serve substring search (ILIKE '%...%') on both columns
+        Index(
+            "ix_translation_key_trgm",
+            "key",
+            postgresql_using="gin",
+            postgresql_ops={"key": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_translation_value_trgm",
+            "value",
+            postgresql_using="gin",
+            postgresql_ops={"value": "gin_trgm_ops"},
+        ),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    # Used to detect changes. Inserts get the server default; updates through
+    # SQLAlchemy get `onupdate` and the upserts set it explicitly, so raw SQL
+    # updates elsewhere must set it themselves.
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(
+            DateTime(timezone=True),
+            nullable=False,
+            index=True,
+            server_default=func.now(),
+            onupdate=func.now(),
+        ),
+    )
+
+
+class TranslationChange(SQLModel, table=True):
+    """
+    History of translation writes, one row per changed key.
+    - The autoincrementing `id` doubles as the catalog version clients sync from.
+    - `value` is None when the key was deleted.
+    """
+
+    __table_args__ = (
+        Index("ix_translationchange_language_code_id", "language_code", "id"),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    language_code: str = Field(max_length=5)
+    key: str = Field(max_length=255)
+    value: str | None = Field(default=None, max_length=1000)
+    changed_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(
+            DateTime(timezone=True), nullable=False, server_default=func.now()
+        ),
+    )
 
 
 class TranslationCreate(TranslationBase):
@@ -32,4 +96,23 @@ class TranslationCreateSchema(TranslationBase):
         ..., min_length=2, max_length=5, description="Language code (e.g., 'en', 'cs')"
     )
     key: str = Field(..., min_length=1, max_length=255, description="Translation key")
-    value: str = Field(..., min_length=1, description="Translation value")
+    value: str = Field(
+        ..., min_length=1, max_length=1000, description="Translation value"
+    )
+
+
+class TranslationDelta(SQLModel):
+    key: str
+    value: str | None = None  # None when the key was deleted
+
+
+class TranslationChangesPublic(SQLModel):
+    language_code: str
+    version: int
+    changes: list[TranslationDelta]
+
+
+class TranslationsPublic(SQLModel):
+    data: list[TranslationPublic]
+    next_cursor: str | None = None  # Pass as `after` to get the next page
+    estimated_total: int | None = None
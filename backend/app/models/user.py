@@ -64,6 +64,11 @@ class UserPublic(UserBase):
     preferred_language: str
 
 
+class UserUpdateMePublic(UserPublic):
+    # Set when the update changed claims embedded in the access token
+    access_token: str | None = None
+
+
 class UsersPublic(SQLModel):
     data: list[UserPublic]
     count: int
@@ -1,26 +1,234 @@
+import logging
+from collections.abc import AsyncIterable, Iterator
+
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from starlette.concurrency import run_in_threadpool
+
+from app.core.database.database import SessionLocal
 from app.core.database.dependencies import SessionDep
-from app.core.utils.cache_utils import (
-    load_translations_from_cache,
-    save_translations_to_cache,
-)
+from app.core.utils.cache_utils import append_translation_changes
+from app.core.utils.translation_bundles import TranslationBundle, bundles
+from app.core.utils.translation_catalog import catalog
+from app.core.utils.translation_export import ExportFormat, encode_translations
+from app.core.utils.translation_import import iter_ndjson_lines
 from app.crud import crud_translation
-from app.models.translation import Translation
+from app.models.translation import (
+    Translation,
+    TranslationCreateSchema,
+    TranslationsPublic,
+)
+
+logger = logging.getLogger(__name__)
+
+# Invalid lines reported back in full; later ones are only counted
+IMPORT_MAX_REPORTED_ERRORS = 100
 
 
 async def add_translation(db: SessionDep, language_code: str, key: str, value: str):
     new_translation = crud_translation.create_translation(
         db, Translation(language_code=language_code, key=key, value=value)
     )
-    translations = load_translations_from_cache()
-    translations.setdefault(language_code, {})[key] = value
-    save_translations_to_cache(translations)
+    changes = [
+        {"op": "set", "language_code": language_code, "key": key, "value": value}
+    ]
+    catalog.apply_changes(changes)
+    append_translation_changes(changes)
     return new_translation
 
 
+async def add_translations_bulk(
+    db: SessionDep, translations: list[dict[str, str]]
+) -> tuple[int, list[dict[str, str]]]:
+    """
+    Insert translations in a single transaction and update the cache once.
+    Returns the number of inserted rows and the rows that already existed.
+    """
+    inserted = set(crud_translation.bulk_create_translations(db, translations))
+    changes = []
+    conflicts = []
+    for row in translations:
+        pair = (row["language_code"], row["key"])
+        if pair in inserted:
+            # The first occurrence of a pair is the one that got inserted
+            inserted.discard(pair)
+            changes.append({"op": "set", **row})
+        else:
+            conflicts.append({"language_code": pair[0], "key": pair[1]})
+
+    catalog.apply_changes(changes)
+    append_translation_changes(changes)
+    return len(translations) - len(conflicts), conflicts
+
+
+async def import_translations_ndjson(
+    db: SessionDep, body: AsyncIterable[bytes], chunk_size: int
+) -> dict:
+    """
+    Validate and upsert an NDJSON stream of translations, committing every
+    `chunk_size` valid rows, so memory use does not depend on the body size.
+    - Invalid lines are skipped and reported. A chunk the database rejects is
+      rolled back and its lines are reported; committed chunks stay committed.
+    - Other workers are notified once, after the last chunk: with the changes
+      themselves if there are few, else with a reload per changed language.
+    """
+    report = {"lines": 0, "chunks": 0, "upserted": 0, "unchanged": 0, "failed": 0}
+    errors: list[dict] = []
+    batch: list[dict[str, str]] = []
+    batch_lines: list[int] = []
+    # Changes to announce, until there are too many to send one by one
+    announced: list[dict[str, str]] | None = []
+    changed_languages: set[str] = set()
+
+    def report_error(line_number: int, error: str) -> None:
+        report["failed"] += 1
+        if len(errors) < IMPORT_MAX_REPORTED_ERRORS:
+            errors.append({"line": line_number, "error": error})
+
+    async def flush() -> None:
+        nonlocal announced
+        try:
+            changes = await run_in_threadpool(
+                crud_translation.upsert_translations, db, batch, False
+            )
+        except SQLAlchemyError as e:
+            await run_in_threadpool(db.rollback)
+            logger.warning("Translation import chunk rejected: %s", e)
+            error = f"rejected by the database: {getattr(e, 'orig', e)}"
+            for line_number in batch_lines:
+                report_error(line_number, error)
+        else:
+            catalog.apply_changes(changes)
+            append_translation_changes(changes)
+            changed_languages.update(change["language_code"] for change in changes)
+            if announced is not None:
+                announced.extend(changes)
+                if len(announced) > crud_translation.NOTIFY_MAX_CHANGES:
+                    announced = None
+            report["chunks"] += 1
+            report["upserted"] += len(changes)
+            report["unchanged"] += len(batch) - len(changes)
+        logger.info(
+            "Translation import: %(lines)d lines, %(upserted)d upserted", report
+        )
+        batch.clear()
+        batch_lines.clear()
+
+    def announce() -> None:
+        if announced is not None:
+            crud_translation.notify_translation_changes(db, announced)
+        else:
+            crud_translation.notify_translation_reload(db, sorted(changed_languages))
+        db.commit()
+
+    try:
+        async for line_number, line in iter_ndjson_lines(body):
+            report["lines"] = line_number
+            if line is not None and not line.strip():
+                continue
+            if line is None:
+                report_error(line_number, "line too long")
+                continue
+            try:
+                row = TranslationCreateSchema.model_validate_json(line)
+            except ValidationError as e:
+                report_error(
+                    line_number,
+                    "; ".join(
+                        f"{'.'.join(map(str, err['loc'])) or 'line'}: {err['msg']}"
+                        for err in e.errors()
+                    ),
+                )
+                continue
+            batch.append(row.model_dump())
+            batch_lines.append(line_number)
+            if len(batch) >= chunk_size:
+                await flush()
+        if batch:
+            await flush()
+    finally:
+        # Also after an aborted upload: committed chunks must reach every worker
+        if changed_languages:
+            await run_in_threadpool(announce)
+    return {**report, "errors": errors}
+
+
+def load_language(language_code: str) -> dict[str, str]:
+    """Catalog loader: read one language from the database."""
+    with SessionLocal() as db:
+        return {
+            key: value
+            for _, key, value in crud_translation.get_translation_values(
+                db, [language_code]
+            )
+        }
+
+
+async def get_translation_bundle(language_code: str) -> TranslationBundle | None:
+    if not catalog.is_resident(language_code):
+        await run_in_threadpool(catalog.ensure_loaded, language_code)
+    return bundles.get(language_code)
+
+
+async def list_translation_bundles() -> dict[str, TranslationBundle | None]:
+    """
+    Return the bundle of every language without loading any: languages that
+    are not resident map to None and are loaded when their bundle is requested.
+    """
+    result: dict[str, TranslationBundle | None] = {}
+    for language_code in sorted(catalog.language_codes()):
+        if not catalog.is_resident(language_code):
+            result[language_code] = None
+        elif (bundle := bundles.get(language_code)) is not None:
+            result[language_code] = bundle
+    return result
+
+
+def fetch_translation_changes(
+    db: SessionDep, language_code: str, since: int
+) -> tuple[int, list[tuple[str, str | None]]]:
+    """
+    Return the current version of a language and the latest value of every
+    key changed after version `since` (None for deleted keys).
+    """
+    version = crud_translation.get_latest_change_id(db, language_code)
+    if since >= version:
+        return version, []
+    return version, crud_translation.get_translation_changes(
+        db, language_code, since, version
+    )
+
+
 def fetch_translations(db: SessionDep, language_code: str):
     return crud_translation.get_translations_by_language(db, language_code)
 
 
+def fetch_translations_page(
+    db: SessionDep,
+    language_code: str,
+    limit: int,
+    after: str | None = None,
+    prefix: str | None = None,
+    search: str | None = None,
+    include_total: bool = False,
+) -> TranslationsPublic:
+    # One extra row tells whether another page follows
+    translations = crud_translation.get_translations_page(
+        db, language_code, limit + 1, after, prefix, search
+    )
+    next_cursor = translations[limit - 1].key if len(translations) > limit else None
+    estimated_total = None
+    if include_total:
+        estimated_total = crud_translation.estimate_translations_count(
+            db, language_code, prefix, search
+        )
+    return TranslationsPublic(
+        data=translations[:limit],
+        next_cursor=next_cursor,
+        estimated_total=estimated_total,
+    )
+
+
 def fetch_translation(db: SessionDep, language_code: str, key: str):
     return crud_translation.get_translation_by_key(db, language_code, key)
 
@@ -28,34 +236,97 @@ def fetch_translation(db: SessionDep, language_code: str, key: str):
 async def modify_translation(
     db: SessionDep, translation_id: str, translation_data: dict
 ):
+    previous = crud_translation.get_translation(db, translation_id)
+    previous_pair = (previous.language_code, previous.key)
     updated_translation = crud_translation.update_translation(
         db, translation_id, translation_data
     )
-    translations = load_translations_from_cache()
-    translations[updated_translation.language_code][
-        updated_translation.key
-    ] = updated_translation.value
-    save_translations_to_cache(translations)
+    changes = [
+        {
+            "op": "set",
+            "language_code": updated_translation.language_code,
+            "key": updated_translation.key,
+            "value": updated_translation.value,
+        }
+    ]
+    if previous_pair != (updated_translation.language_code, updated_translation.key):
+        changes.insert(
+            0,
+            {
+                "op": "delete",
+                "language_code": previous_pair[0],
+                "key": previous_pair[1],
+            },
+        )
+    catalog.apply_changes(changes)
+    append_translation_changes(changes)
     return updated_translation
 
 
 async def remove_translation(db: SessionDep, translation_id: str):
     translation = crud_translation.delete_translation(db, translation_id)
-    translations = load_translations_from_cache()
-    if translation.language_code in translations:
-        translations[translation.language_code].pop(translation.key, None)
-    save_translations_to_cache(translations)
+    changes = [
+        {
+            "op": "delete",
+            "language_code": translation.language_code,
+            "key": translation.key,
+        }
+    ]
+    catalog.apply_changes(changes)
+    append_translation_changes(changes)
     return translation
 
 
+def apply_translation_change(change: dict[str, str]) -> bool:
+    """
+    Apply a change announced by another worker to the in-memory catalog.
+    Returns False when the change asks for a full reload instead.
+    """
+    if change.get("op") not in ("set", "delete"):
+        return False
+    catalog.apply_changes([change])
+    return True
+
+
+def export_translations(
+    export_format: ExportFormat,
+    languages: list[str] | None = None,
+    compress: bool = False,
+) -> Iterator[bytes]:
+    """
+    Stream the translation table as encoded chunks.
+    The generator owns its session, since it outlives the request handler.
+    """
+    with SessionLocal() as db:
+        yield from encode_translations(
+            crud_translation.iter_translation_values(db, languages),
+            export_format,
+            compress,
+        )
+
+
+def fetch_language_codes(db: SessionDep) -> list[str]:
+    return crud_translation.get_language_codes(db)
+
+
+def fetch_translation_fingerprint(db: SessionDep) -> list:
+    """Return the table fingerprint in the JSON form kept in the cache header."""
+    count, updated_at = crud_translation.get_translation_fingerprint(db)
+    return [count, updated_at.isoformat() if updated_at else None]
+
+
 async def fetch_all_translations_bulk(db: SessionDep, languages: list[str]) -> dict:
     """
     Fetch translations for multiple languages at once and return a dictionary
     mapping language codes to translation dictionaries.
     """
-    translations_dict = {}
-    for lang in languages:
-        translations = crud_translation.get_translations_by_language(db, lang)
-        # Build a dictionary: key is the translation key, value is its translation value
-        translations_dict[lang] = {t.key: t.value for t in translations}
+    return collect_translations(db, languages)
+
+
+def collect_translations(db: SessionDep, languages: list[str]) -> dict:
+    """Blocking counterpart of `fetch_all_translations_bulk`."""
+    translations_dict: dict[str, dict[str, str]] = {lang: {} for lang in languages}
+    rows = crud_translation.get_translation_values(db, languages)
+    for language_code, key, value in rows:
+        translations_dict[language_code][key] = value
     return translations_dict
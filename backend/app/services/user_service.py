@@ -6,6 +6,8 @@ from fastapi import HTTPException, Request
 from sqlmodel import Session, func, select
 
 from app.core.config.settings import settings
+from app.core.security.refresh_token_service import create_user_access_token
+from app.core.security.user_cache import user_cache
 from app.core.utils.email import generate_new_account_email, send_email
 from app.core.utils.translation_helper import (
     translate,  # <-- Use the translation helper
@@ -60,11 +62,23 @@ def update_user_profile(
                 status_code=409, detail=translate(request, "user_email_already_exists")
             )
 
-    current_user.sqlmodel_update(user_in.model_dump(exclude_unset=True))
+    update_data = user_in.model_dump(exclude_unset=True)
+    claims_changed = any(
+        field in update_data and update_data[field] != getattr(current_user, field)
+        for field in ("email", "preferred_language")
+    )
+
+    current_user.sqlmodel_update(update_data)
     session.add(current_user)
     session.commit()
+    user_cache.invalidate(user_id=current_user.id)
     session.refresh(current_user)
-    return current_user
+
+    # The old access token carries a stale email/language, issue a fresh one
+    access_token = create_user_access_token(current_user) if claims_changed else None
+    return user.UserUpdateMePublic.model_validate(
+        current_user, update={"access_token": access_token}
+    )
 
 
 def delete_self(session: Session, current_user, request: Request = None) -> Any:
@@ -75,6 +89,7 @@ def delete_self(session: Session, current_user, request: Request = None) -> Any:
 
     session.delete(current_user)
     session.commit()
+    user_cache.invalidate(user_id=current_user.id, email=current_user.email)
     return common.Message(message=translate(request, "user_deleted_successfully"))
 
 
@@ -131,6 +146,7 @@ def delete_user(
 
     session.delete(user_instance)
     session.commit()
+    user_cache.invalidate(user_id=user_instance.id, email=user_instance.email)
     return common.Message(message=translate(request, "user_deleted_successfully"))
 
 
@@ -1,6 +1,10 @@
 from pydantic.networks import EmailStr
 
+from app.core.security.password_hashing import hashing_executor
+from app.core.security.user_cache import user_cache
 from app.core.utils.email import generate_test_email, send_email
+from app.core.utils.language_negotiation import negotiator
+from app.core.utils.translation_catalog import catalog
 from app.models import Message
 
 
@@ -18,3 +22,13 @@ def send_test_email(email_to: EmailStr) -> Message:
 def perform_health_check() -> bool:
     """Return API health status."""
     return True
+
+
+def collect_metrics() -> dict:
+    """Return the in-process cache and pool counters of this worker."""
+    return {
+        "user_cache": user_cache.stats(),
+        "password_hashing": hashing_executor.stats(),
+        "language_negotiation": negotiator.stats(),
+        "translation_catalog": catalog.stats(),
+    }
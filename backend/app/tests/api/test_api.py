@@ -69,10 +69,10 @@ def test_login_validation_error():
 
 def test_refresh_token_success():
     payload = {"refresh_token": "valid_refresh_token"}
-    # Patch the verify_refresh_token function from the correct module.
+    # Patch the rotate_refresh_token function from the correct module.
     with patch(
-        "app.api.routes.auth_routes.verify_refresh_token",
-        return_value=("user@example.com", "local"),
+        "app.api.routes.auth_routes.rotate_refresh_token",
+        return_value=("new_refresh_token", "user@example.com", "local"),
     ):
         app.dependency_overrides[get_current_user] = dummy_user
         response = client.post("/api/v1/auth/token/refresh", json=payload)
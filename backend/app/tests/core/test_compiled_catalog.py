@@ -0,0 +1,63 @@
+import os
+
+import pytest
+
+from app.core.utils.compiled_catalog import (
+    CompiledCatalogError,
+    open_compiled_catalog,
+    write_compiled_catalog,
+)
+from app.core.utils.translation_catalog import TranslationCatalog
+
+TRANSLATIONS = {
+    "en": {"hello": "Hello", "bye": "Goodbye", "zebra": "Zebra"},
+    "cs": {"hello": "Ahoj", "žluť": "Žlutá"},
+    "de": {},
+}
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "catalog.bin")
+    write_compiled_catalog(path, TRANSLATIONS)
+
+    languages = open_compiled_catalog(path)
+
+    assert {code: dict(values) for code, values in languages.items()} == TRANSLATIONS
+    assert languages["cs"]["žluť"] == "Žlutá"
+    assert languages["en"].get("missing") is None
+    assert "bye" in languages["en"]
+    assert len(languages["en"]) == 3
+    with pytest.raises(KeyError):
+        languages["de"]["hello"]
+
+
+def test_unchanged_content_is_not_rewritten(tmp_path):
+    path = str(tmp_path / "catalog.bin")
+    assert write_compiled_catalog(path, TRANSLATIONS) is True
+    inode = os.stat(path).st_ino
+
+    assert write_compiled_catalog(path, TRANSLATIONS) is False
+    assert os.stat(path).st_ino == inode
+
+    assert write_compiled_catalog(path, {"en": {"hello": "Hi"}}) is True
+    assert open_compiled_catalog(path)["en"]["hello"] == "Hi"
+
+
+def test_invalid_file_is_rejected(tmp_path):
+    path = tmp_path / "catalog.bin"
+    path.write_bytes(b"")
+    with pytest.raises(CompiledCatalogError):
+        open_compiled_catalog(str(path))
+
+
+def test_catalog_edits_copy_mapped_language(tmp_path):
+    path = str(tmp_path / "catalog.bin")
+    write_compiled_catalog(path, TRANSLATIONS)
+    catalog = TranslationCatalog()
+    catalog.load_compiled(path)
+
+    catalog.set("en", "new", "New")
+    catalog.remove("cs", "hello")
+
+    assert catalog.get_language("en") == {**TRANSLATIONS["en"], "new": "New"}
+    assert catalog.get_language("cs") == {"žluť": "Žlutá"}
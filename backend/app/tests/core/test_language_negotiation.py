@@ -0,0 +1,46 @@
+from app.core.utils.language_negotiation import (
+    LanguageNegotiator,
+    lookup_language,
+    parse_accept_language,
+)
+from app.core.utils.translation_catalog import TranslationCatalog
+
+
+def test_parse_orders_by_quality():
+    assert parse_accept_language("de;q=0.5, cs-CZ, en;q=0.8, fr;q=0") == [
+        "cs-CZ",
+        "en",
+        "de",
+    ]
+    assert parse_accept_language("en;q=abc, cs") == ["cs"]
+
+
+def test_lookup_truncates_ranges():
+    available = {"en", "cs", "zh-Hant"}
+    assert lookup_language(["cs-CZ"], available) == "cs"
+    assert lookup_language(["zh-hant-TW"], available) == "zh-Hant"
+    assert lookup_language(["de", "*", "en"], available) == "en"
+    assert lookup_language(["de-x-private"], available) is None
+
+
+def test_negotiator_caches_by_header_and_tracks_languages():
+    catalog = TranslationCatalog()
+    catalog.replace({"en": {}, "cs": {}})
+    negotiator = LanguageNegotiator(catalog, max_size=2)
+
+    assert negotiator.negotiate("de, cs;q=0.9") == "cs"
+    assert negotiator.negotiate("de, cs;q=0.9") == "cs"
+    assert negotiator.stats()["hits"] == 1
+
+    catalog.set("de", "hello", "Hallo")
+    assert negotiator.negotiate("de, cs;q=0.9") == "de"
+    assert negotiator.negotiate(None) == "en"
+
+
+def test_negotiator_is_bounded():
+    catalog = TranslationCatalog()
+    catalog.replace({"en": {}})
+    negotiator = LanguageNegotiator(catalog, max_size=2)
+    for header in ("a", "b", "c"):
+        negotiator.negotiate(header)
+    assert negotiator.stats()["size"] == 2
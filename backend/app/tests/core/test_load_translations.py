@@ -0,0 +1,35 @@
+import gzip
+
+import pytest
+
+from app.core.database.load_translations import read_translation_file
+
+
+def test_reads_gzipped_ndjson_and_skips_blank_lines(tmp_path):
+    path = tmp_path / "de.ndjson.gz"
+    path.write_bytes(
+        gzip.compress(
+            b'{"language_code": "de", "key": "hello", "value": "Hallo"}\n'
+            b"\n"
+            b'{"language_code": "de", "key": "bye", "value": "Tsch\\u00fcss"}\n'
+        )
+    )
+    assert list(read_translation_file(path)) == [
+        ("de", "hello", "Hallo"),
+        ("de", "bye", "Tschüss"),
+    ]
+
+
+def test_reads_csv_with_header(tmp_path):
+    path = tmp_path / "fr.csv"
+    path.write_text(
+        'language_code,key,value\r\nfr,hello,"Bonjour, toi"\r\n', encoding="utf-8"
+    )
+    assert list(read_translation_file(path)) == [("fr", "hello", "Bonjour, toi")]
+
+
+def test_invalid_record_names_file_and_record(tmp_path):
+    path = tmp_path / "bad.ndjson"
+    path.write_text('{"language_code": "de", "key": "", "value": "x"}\n')
+    with pytest.raises(ValueError, match="bad.ndjson: record 1"):
+        list(read_translation_file(path))
@@ -0,0 +1,54 @@
+import threading
+import time
+
+from app.core.security.password_hashing import HashingExecutor
+from app.core.security.password_security import _bcrypt_hash, _bcrypt_verify
+
+
+def test_thread_executor_runs_and_counts():
+    executor = HashingExecutor(kind="thread", max_workers=2, max_pending=4)
+    try:
+        assert executor.run(pow, 2, 10) == 1024
+        stats = executor.stats()
+        assert stats["completed"] == 1
+        assert stats["queue_depth"] == 0
+        assert stats["max_queue_depth"] == 1
+    finally:
+        executor.shutdown()
+
+
+def test_process_executor_hashes_passwords():
+    executor = HashingExecutor(kind="process", max_workers=1, max_pending=2)
+    try:
+        hashed = executor.run(_bcrypt_hash, "secret123")
+        assert executor.run(_bcrypt_verify, "secret123", hashed)
+        assert not executor.run(_bcrypt_verify, "wrong", hashed)
+    finally:
+        executor.shutdown()
+
+
+def test_queue_depth_counts_callers_waiting_for_a_slot():
+    executor = HashingExecutor(kind="thread", max_workers=1, max_pending=1)
+    release = threading.Event()
+    results = []
+    callers = [
+        threading.Thread(target=lambda: results.append(executor.run(release.wait))),
+        threading.Thread(target=lambda: results.append(executor.run(pow, 2, 10))),
+    ]
+
+    try:
+        for caller in callers:
+            caller.start()
+        time.sleep(0.05)
+        # The second caller holds no pool slot yet but is still queued
+        assert executor.stats()["queue_depth"] == 2
+        release.set()
+        for caller in callers:
+            caller.join()
+        assert sorted(results, key=str) == [1024, True]
+        stats = executor.stats()
+        assert stats["completed"] == 2
+        assert stats["queue_depth"] == 0
+        assert stats["max_queue_depth"] == 2
+    finally:
+        executor.shutdown()
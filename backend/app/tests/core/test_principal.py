@@ -0,0 +1,84 @@
+import uuid
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+from sqlmodel import Session
+
+from app.core.security.principal import RequestPrincipal
+from app.core.security.refresh_token_service import create_access_token
+from app.core.security.user_cache import user_cache
+from app.models.user import User
+
+
+def make_token(email: str = "principal@example.com") -> str:
+    return create_access_token(email, expires_delta=timedelta(minutes=5))
+
+
+def test_principal_decodes_token():
+    principal = RequestPrincipal(make_token())
+    assert principal.payload is not None
+    assert principal.payload.sub == "principal@example.com"
+
+
+def test_principal_invalid_token():
+    principal = RequestPrincipal("not-a-jwt")
+    assert principal.payload is None
+    assert principal.load_user(MagicMock(spec=Session)) is None
+
+
+def test_principal_loads_user_once():
+    user_cache.clear()
+    dummy_user = User(
+        id=uuid.uuid4(), email="principal@example.com", auth_provider="local"
+    )
+    session = MagicMock(spec=Session)
+    session.exec.return_value.first.return_value = dummy_user
+    session.__contains__.return_value = True
+
+    principal = RequestPrincipal(make_token())
+    assert principal.load_user(session) is dummy_user
+    assert principal.load_user(session) is dummy_user
+    session.exec.assert_called_once()
+
+
+def test_principal_attaches_user_to_new_session():
+    user_cache.clear()
+    dummy_user = User(
+        id=uuid.uuid4(), email="principal@example.com", auth_provider="local"
+    )
+    middleware_session = MagicMock(spec=Session)
+    middleware_session.exec.return_value.first.return_value = dummy_user
+    middleware_session.__contains__.return_value = True
+    request_session = MagicMock(spec=Session)
+    request_session.__contains__.return_value = False
+    request_session.merge.return_value = dummy_user
+
+    principal = RequestPrincipal(make_token())
+    principal.load_user(middleware_session)
+    principal.load_user(request_session)
+
+    request_session.exec.assert_not_called()
+    request_session.merge.assert_called_once_with(dummy_user, load=False)
+
+
+def test_cached_user_is_found_by_user_id_claim():
+    user_cache.clear()
+    dummy_user = User(
+        id=uuid.uuid4(),
+        email="renamed@example.com",
+        auth_provider="local",
+        preferred_language="de",
+    )
+    user_cache.put(dummy_user)
+    token = create_access_token(
+        "principal@example.com",
+        expires_delta=timedelta(minutes=5),
+        user_id=dummy_user.id,
+        preferred_language="en",
+    )
+
+    cached_user = RequestPrincipal(token).cached_user()
+
+    assert cached_user is not None
+    assert cached_user.preferred_language == "de"
+    assert RequestPrincipal(make_token()).cached_user() is None
@@ -0,0 +1,57 @@
+import asyncio
+import gzip
+import json
+from unittest.mock import patch
+
+from app.core.utils.translation_bundles import TranslationBundleCache, etag_matches
+from app.core.utils.translation_catalog import TranslationCatalog
+
+
+def test_bundle_is_serialized_once_per_change():
+    catalog = TranslationCatalog()
+    catalog.replace({"en": {"hello": "Hello"}, "cs": {"hello": "Ahoj"}})
+    bundles = TranslationBundleCache(catalog)
+
+    first = bundles.get("en")
+    cs_bundle = bundles.get("cs")
+    assert json.loads(first.body) == {"hello": "Hello"}
+    assert gzip.decompress(first.gzipped) == first.body
+    assert bundles.get("en") is first
+
+    catalog.set("en", "bye", "Goodbye")
+    second = bundles.get("en")
+    assert second is not first
+    assert second.etag != first.etag
+    # Other languages keep their bundle and ETag
+    assert bundles.get("cs") is cs_bundle
+
+
+def test_unknown_language_has_no_bundle():
+    bundles = TranslationBundleCache(TranslationCatalog())
+    assert bundles.get("xx") is None
+
+
+def test_etag_matches():
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('W/"abc", "def"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches('"def"', '"abc"')
+    assert not etag_matches(None, '"abc"')
+
+
+def test_listing_bundles_does_not_load_languages():
+    from app.services import translation_service
+
+    loaded = []
+    catalog = TranslationCatalog(loader=lambda code: loaded.append(code) or {})
+    catalog.replace({"en": {"hello": "Hello"}})
+    catalog.set_known_languages(["en", "cs"])
+    with (
+        patch.object(translation_service, "catalog", catalog),
+        patch.object(translation_service, "bundles", TranslationBundleCache(catalog)),
+    ):
+        listed = asyncio.run(translation_service.list_translation_bundles())
+
+    assert listed["en"].language_code == "en"
+    assert listed["cs"] is None
+    assert loaded == []
@@ -0,0 +1,242 @@
+from unittest.mock import patch
+
+from app.core.utils.translation_catalog import TranslationCatalog
+
+
+def test_load_reads_cache_file_once():
+    catalog = TranslationCatalog()
+    with (
+        patch(
+            "app.core.utils.translation_catalog.load_versioned_translations_from_cache",
+            return_value=(1, {"en": {"hello": "Hello"}}),
+        ) as mock_load,
+        patch(
+            "app.core.utils.translation_catalog.read_catalog_header", return_value=None
+        ),
+        patch(
+            "app.core.utils.translation_catalog.read_translation_changes",
+            return_value=[],
+        ),
+    ):
+        catalog.load()
+        # Lookups are served from memory and never touch the file again.
+        assert catalog.get_language("en")["hello"] == "Hello"
+        assert catalog.get_language("en").get("hello") == "Hello"
+    mock_load.assert_called_once()
+
+
+def test_get_unknown_language_returns_empty_dict():
+    catalog = TranslationCatalog()
+    assert catalog.get_language("xx") == {}
+
+
+def test_set_swaps_in_new_snapshot():
+    catalog = TranslationCatalog()
+    catalog.replace({"en": {"hello": "Hello"}})
+    before = catalog.get_language("en")
+
+    catalog.set("en", "bye", "Goodbye")
+
+    # Readers holding the old snapshot are unaffected by the write.
+    assert "bye" not in before
+    assert catalog.get_language("en") == {"hello": "Hello", "bye": "Goodbye"}
+
+
+def test_remove_translation():
+    catalog = TranslationCatalog()
+    catalog.replace({"cs": {"hello": "Ahoj", "bye": "Nashledanou"}})
+    catalog.remove("cs", "bye")
+    catalog.remove("cs", "missing")
+    assert catalog.get_language("cs") == {"hello": "Ahoj"}
+
+
+def test_change_log_replayed_on_load(tmp_path, monkeypatch):
+    from app.core.utils import cache_utils
+
+    monkeypatch.setattr(cache_utils, "CACHE_FILE", str(tmp_path / "cache.json"))
+    monkeypatch.setattr(cache_utils, "CHANGE_LOG_FILE", str(tmp_path / "changes.log"))
+    cache_utils.save_translations_to_cache({"en": {"hello": "Hello", "old": "Old"}})
+    cache_utils.append_translation_changes(
+        [
+            {"op": "set", "language_code": "en", "key": "hello", "value": "Hi"},
+            {"op": "delete", "language_code": "en", "key": "old"},
+            {"op": "set", "language_code": "cs", "key": "hello", "value": "Ahoj"},
+        ]
+    )
+
+    catalog = TranslationCatalog()
+    catalog.load()
+
+    assert catalog.snapshot() == {"en": {"hello": "Hi"}, "cs": {"hello": "Ahoj"}}
+
+
+def test_compaction_keeps_changes_newer_than_snapshot(tmp_path, monkeypatch):
+    from app.core.utils import cache_utils
+
+    monkeypatch.setattr(cache_utils, "CACHE_FILE", str(tmp_path / "cache.json"))
+    monkeypatch.setattr(cache_utils, "CHANGE_LOG_FILE", str(tmp_path / "changes.log"))
+    cache_utils.append_translation_changes(
+        [
+            {"op": "set", "language_code": "en", "key": "a", "value": "1"},
+            {"op": "set", "language_code": "en", "key": "a", "value": "2"},
+        ]
+    )
+    # The snapshot was read after "a" became "2" but before "b" was written
+    log_offset = cache_utils.change_log_offset()
+    cache_utils.append_translation_changes(
+        [{"op": "set", "language_code": "en", "key": "b", "value": "new"}]
+    )
+
+    cache_utils.compact_translation_cache({"en": {"a": "2"}}, log_offset=log_offset)
+
+    assert cache_utils.read_translation_changes() == [
+        {"op": "set", "language_code": "en", "key": "b", "value": "new"}
+    ]
+
+
+def test_compaction_drops_changes_the_snapshot_superseded(tmp_path, monkeypatch):
+    from app.core.utils import cache_utils
+
+    monkeypatch.setattr(cache_utils, "CACHE_FILE", str(tmp_path / "cache.json"))
+    monkeypatch.setattr(cache_utils, "CHANGE_LOG_FILE", str(tmp_path / "changes.log"))
+    cache_utils.save_translations_to_cache({"en": {"k": "old"}})
+    cache_utils.append_translation_changes(
+        [{"op": "set", "language_code": "en", "key": "k", "value": "local"}]
+    )
+    # Another node overwrote "k" before the snapshot was read
+    log_offset = cache_utils.change_log_offset()
+    cache_utils.compact_translation_cache({"en": {"k": "pack"}}, log_offset=log_offset)
+
+    catalog = TranslationCatalog()
+    catalog.load()
+
+    assert catalog.get_language("en") == {"k": "pack"}
+
+
+def test_reload_if_changed_only_on_new_version(tmp_path, monkeypatch):
+    from app.core.utils import cache_utils, compiled_catalog, translation_catalog
+
+    monkeypatch.setattr(cache_utils, "CACHE_FILE", str(tmp_path / "cache.json"))
+    monkeypatch.setattr(cache_utils, "CHANGE_LOG_FILE", str(tmp_path / "changes.log"))
+    compiled_path = str(tmp_path / "catalog.bin")
+    monkeypatch.setattr(translation_catalog, "COMPILED_CATALOG_FILE", compiled_path)
+
+    assert cache_utils.save_translations_to_cache({"en": {"hello": "Hello"}}) == 1
+    catalog = TranslationCatalog()
+    catalog.load()
+    assert catalog.version == 1
+    assert catalog.reload_if_changed() is False
+
+    # Another worker writes version 2 together with its compiled catalog
+    fingerprint = [1, "2026-10-17T11:22:45+00:00"]
+    version = cache_utils.save_translations_to_cache(
+        {"en": {"hello": "Hi"}}, fingerprint
+    )
+    compiled_catalog.write_compiled_catalog(compiled_path, {"en": {"hello": "Hi"}}, 2)
+
+    assert version == 2
+    assert catalog.reload_if_changed() is True
+    assert catalog.version == 2
+    # The database state it was read at is adopted with it
+    assert catalog.fingerprint == fingerprint
+    assert isinstance(catalog.get_language("en"), compiled_catalog.CompiledLanguage)
+    assert catalog.get_language("en")["hello"] == "Hi"
+    assert catalog.reload_if_changed() is False
+
+
+def test_legacy_cache_file_without_header(tmp_path, monkeypatch):
+    from app.core.utils import cache_utils
+
+    path = tmp_path / "cache.json"
+    path.write_text('{\n    "en": {\n        "hello": "Hello"\n    }\n}')
+    monkeypatch.setattr(cache_utils, "CACHE_FILE", str(path))
+
+    assert cache_utils.load_versioned_translations_from_cache() == (
+        0,
+        {"en": {"hello": "Hello"}},
+    )
+    assert cache_utils.save_translations_to_cache({"en": {}}) == 1
+
+
+def test_locale_merged_along_fallback_chain():
+    catalog = TranslationCatalog()
+    catalog.replace(
+        {
+            "en": {"hello": "Hello", "bye": "Goodbye", "ok": "OK"},
+            "cs": {"hello": "Ahoj", "bye": "Nashle"},
+            "cs-CZ": {"hello": "Dobrý den"},
+        }
+    )
+
+    assert catalog.get_locale("cs-CZ") == {
+        "hello": "Dobrý den",
+        "bye": "Nashle",
+        "ok": "OK",
+    }
+    assert catalog.get_locale("cs_cz") is catalog.get_locale("cs-CZ")
+    assert catalog.get_locale("cs-CZ")["bye"] == "Nashle"
+    assert catalog.get_locale("cs-CZ").get("missing", "missing") == "missing"
+    # Merged locales reference the languages instead of copying them
+    assert not isinstance(catalog.get_locale("cs-CZ"), dict)
+    assert catalog.get_locale("cs-SK") == {"hello": "Ahoj", "bye": "Nashle", "ok": "OK"}
+    assert catalog.get_locale("de") is catalog.get_language("en")
+
+
+def test_locale_views_rebuilt_after_change():
+    catalog = TranslationCatalog()
+    catalog.replace({"en": {"hello": "Hello"}, "cs": {"hello": "Ahoj"}})
+    before = catalog.get_locale("cs")
+
+    catalog.set("en", "bye", "Goodbye")
+
+    assert before == {"hello": "Ahoj"}
+    assert catalog.get_locale("cs") == {"hello": "Ahoj", "bye": "Goodbye"}
+
+
+def test_locale_with_empty_catalog():
+    assert TranslationCatalog().get_locale("cs") == {}
+
+
+def _language(prefix: str, size: int = 50) -> dict[str, str]:
+    return {f"{prefix}{i}": f"value {prefix} {i}" for i in range(size)}
+
+
+def test_least_recently_used_language_evicted_over_budget():
+    loaded = []
+
+    def loader(language_code):
+        loaded.append(language_code)
+        return _language(language_code)
+
+    catalog = TranslationCatalog(loader=loader)
+    catalog.replace({"en": _language("en"), "cs": _language("cs")})
+    catalog.max_bytes = catalog.stats()["resident_bytes"] + 100
+    catalog.set_known_languages(["en", "cs", "de"])
+
+    catalog.get_language("cs")
+    catalog.ensure_loaded("de")
+
+    # "cs" was used least recently; "en" is never evicted
+    assert loaded == ["de"]
+    assert not catalog.is_resident("cs")
+    assert catalog.is_resident("en") and catalog.is_resident("de")
+    assert catalog.stats()["evictions"] == 1
+    assert catalog.stats()["resident_bytes"] <= catalog.max_bytes
+    assert "cs" in catalog.language_codes()
+
+    # Evicted languages come back on demand, fallback chains included
+    assert catalog.missing_languages("cs-CZ") == ["cs"]
+    catalog.ensure_loaded(*catalog.missing_languages("cs-CZ"))
+    assert catalog.get_locale("cs-CZ")["cs1"] == "value cs 1"
+    assert catalog.stats()["loads"] == 2
+
+
+def test_changes_to_evicted_language_are_not_applied_partially():
+    catalog = TranslationCatalog(loader=lambda code: {"hello": "Ahoj"})
+    catalog.set_known_languages(["cs"])
+
+    catalog.set("cs", "bye", "Nashle")
+    assert not catalog.is_resident("cs")
+
+    catalog.ensure_loaded("cs")
+    assert catalog.get_language("cs") == {"hello": "Ahoj"}
@@ -0,0 +1,38 @@
+import csv
+import gzip
+import io
+import json
+
+from app.core.utils.translation_export import encode_translations
+
+BATCHES = [
+    [("cs", "hello", "Ahoj"), ("en", "greeting", 'Say "hi", then\nwave')],
+    [("en", "hello", "Hello")],
+]
+
+
+def test_ndjson_export_yields_one_chunk_per_batch():
+    chunks = list(encode_translations(iter(BATCHES), "ndjson", compress=False))
+    assert len(chunks) == 2
+    rows = [json.loads(line) for line in b"".join(chunks).decode().splitlines()]
+    assert rows[0] == {"language_code": "cs", "key": "hello", "value": "Ahoj"}
+    assert rows[1]["value"] == 'Say "hi", then\nwave'
+    assert len(rows) == 3
+
+
+def test_csv_export_quotes_values_and_writes_header_once():
+    body = b"".join(encode_translations(iter(BATCHES), "csv", compress=False))
+    rows = list(csv.reader(io.StringIO(body.decode(), newline="")))
+    assert rows[0] == ["language_code", "key", "value"]
+    assert rows[1:] == [list(row) for batch in BATCHES for row in batch]
+
+
+def test_empty_csv_export_still_has_header():
+    body = b"".join(encode_translations(iter([]), "csv", compress=False))
+    assert body == b"language_code,key,value\r\n"
+
+
+def test_compressed_export_is_a_single_gzip_stream():
+    plain = b"".join(encode_translations(iter(BATCHES), "ndjson", compress=False))
+    compressed = b"".join(encode_translations(iter(BATCHES), "ndjson", compress=True))
+    assert gzip.decompress(compressed) == plain
@@ -0,0 +1,118 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.exc import DataError
+
+from app.core.utils.translation_import import iter_ndjson_lines
+
+
+async def _stream(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+def _lines(*chunks: bytes, max_line_bytes: int = 64) -> list:
+    async def collect():
+        return [
+            item async for item in iter_ndjson_lines(_stream(*chunks), max_line_bytes)
+        ]
+
+    return asyncio.run(collect())
+
+
+def test_lines_split_across_chunks_are_joined():
+    assert _lines(b'{"a"', b':1}\n{"b":2}\n', b'{"c":3}') == [
+        (1, b'{"a":1}'),
+        (2, b'{"b":2}'),
+        (3, b'{"c":3}'),
+    ]
+
+
+def test_blank_lines_keep_their_numbers():
+    assert _lines(b"x\n\ny\n") == [(1, b"x"), (2, b""), (3, b"y")]
+
+
+def test_oversized_line_is_dropped_while_streaming():
+    chunks = [b"ok\n" + b"x" * 50, b"x" * 50, b"x" * 50, b"x\nnext\n"]
+    assert _lines(*chunks) == [(1, b"ok"), (2, None), (3, b"next")]
+
+
+def test_oversized_last_line_is_reported():
+    assert _lines(b"ok\n", b"x" * 100) == [(1, b"ok"), (2, None)]
+
+
+def _row(index: int, language_code: str = "en") -> bytes:
+    return (
+        f'{{"language_code": "{language_code}", "key": "k{index}", "value": "v"}}\n'
+    ).encode()
+
+
+def _import(body: bytes, upsert, chunk_size: int = 2) -> tuple[dict, MagicMock]:
+    from app.services import translation_service
+
+    db = MagicMock()
+    with (
+        patch.object(
+            translation_service.crud_translation, "upsert_translations", new=upsert
+        ),
+        patch.object(translation_service, "catalog"),
+        patch.object(translation_service, "append_translation_changes"),
+    ):
+        report = asyncio.run(
+            translation_service.import_translations_ndjson(
+                db, _stream(body), chunk_size
+            )
+        )
+    return report, db
+
+
+def _upsert(_db, rows, notify=True):
+    assert notify is False
+    return [{"op": "set", **row} for row in rows]
+
+
+def test_import_notifies_once_after_the_last_chunk():
+    with patch(
+        "app.crud.crud_translation.notify_translation_changes"
+    ) as notify_changes:
+        report, db = _import(b"".join(_row(i) for i in range(5)), _upsert)
+
+    assert report["chunks"] == 3
+    assert report["upserted"] == 5
+    notify_changes.assert_called_once()
+    assert [change["key"] for change in notify_changes.call_args.args[1]] == [
+        f"k{i}" for i in range(5)
+    ]
+    db.commit.assert_called_once()
+
+
+def test_large_import_notifies_a_reload_per_language():
+    from app.crud.crud_translation import NOTIFY_MAX_CHANGES
+
+    body = b"".join(
+        _row(i, code) for i in range(NOTIFY_MAX_CHANGES) for code in ("cs", "en")
+    )
+    with patch("app.crud.crud_translation.notify_translation_reload") as notify_reload:
+        report, _ = _import(body, _upsert, chunk_size=50)
+
+    assert report["upserted"] == 2 * NOTIFY_MAX_CHANGES
+    notify_reload.assert_called_once()
+    assert notify_reload.call_args.args[1] == ["cs", "en"]
+
+
+def test_chunk_rejected_by_the_database_is_reported():
+    def upsert(db, rows, notify=True):
+        if any(row["key"] == "k2" for row in rows):
+            raise DataError("INSERT", {}, Exception("invalid byte sequence"))
+        return _upsert(db, rows, notify)
+
+    with patch("app.crud.crud_translation.notify_translation_changes"):
+        report, db = _import(b"".join(_row(i) for i in range(5)), upsert)
+
+    db.rollback.assert_called_once()
+    assert report["upserted"] == 3
+    assert report["failed"] == 2
+    assert report["errors"] == [
+        {"line": 3, "error": "rejected by the database: invalid byte sequence"},
+        {"line": 4, "error": "rejected by the database: invalid byte sequence"},
+    ]
@@ -0,0 +1,91 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.core.background_tasks import TranslationReloads
+from app.core.utils.translation_catalog import TranslationCatalog
+
+
+def _set(key: str, value: str) -> dict:
+    return {"op": "set", "language_code": "en", "key": key, "value": value}
+
+
+def test_burst_of_reloads_is_coalesced_per_language():
+    reloads = TranslationReloads()
+
+    async def main():
+        task = asyncio.create_task(reloads.run())
+        for language_code in ("en", "cs", "en"):
+            reloads.submit({"op": "reload", "language_code": language_code})
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+    with (
+        patch(
+            "app.core.background_tasks.reload_translation_languages", new=AsyncMock()
+        ) as reload_languages,
+        patch(
+            "app.core.background_tasks.settings.TRANSLATION_RELOAD_COALESCE_SECONDS", 0
+        ),
+    ):
+        asyncio.run(main())
+    reload_languages.assert_awaited_once_with(["cs", "en"])
+
+
+def test_changes_during_reload_are_applied_after_it():
+    reloads = TranslationReloads()
+    applied = []
+
+    async def slow_reload(persist: bool = True):
+        assert persist is False
+        # Arrives while the database is read; must not be overwritten
+        reloads.submit(_set("hello", "Hi"))
+        assert applied == []
+
+    async def main():
+        task = asyncio.create_task(reloads.run())
+        reloads.submit({"op": "reload"})
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+    with (
+        patch("app.core.background_tasks.reload_translation_cache", new=slow_reload),
+        patch("app.core.background_tasks.apply_translation_change", new=applied.append),
+        patch(
+            "app.core.background_tasks.settings.TRANSLATION_RELOAD_COALESCE_SECONDS", 0
+        ),
+    ):
+        asyncio.run(main())
+        assert applied == [_set("hello", "Hi")]
+        # Without a pending reload changes apply immediately
+        reloads.submit(_set("bye", "Bye"))
+    assert applied == [_set("hello", "Hi"), _set("bye", "Bye")]
+
+
+def test_reload_without_persist_reads_only_resident_languages():
+    from app.core import background_tasks
+
+    catalog = TranslationCatalog(loader=lambda code: {})
+    catalog.replace({"en": {"hello": "Hello"}, "de": {"hello": "Hallo"}})
+    collected = []
+
+    def collect(_db, languages):
+        collected.append(languages)
+        return {"en": {"hello": "Hi"}}
+
+    with (
+        patch.object(background_tasks, "catalog", catalog),
+        patch.object(background_tasks, "SessionLocal", MagicMock()),
+        patch.object(
+            background_tasks, "fetch_translation_fingerprint", return_value=[2, None]
+        ),
+        patch.object(
+            background_tasks, "fetch_language_codes", return_value=["cs", "en"]
+        ),
+        patch.object(background_tasks, "collect_translations", new=collect),
+    ):
+        background_tasks._reload_translation_cache(persist=False)
+
+    # "de" no longer exists and is emptied; "cs" only becomes known
+    assert collected == [["en", "de"]]
+    assert catalog.snapshot() == {"en": {"hello": "Hi"}, "de": {}}
+    assert catalog.language_codes() == {"cs", "de", "en"}
@@ -0,0 +1,55 @@
+import uuid
+from unittest.mock import patch
+
+from app.core.security.user_cache import UserCache
+from app.models.user import User
+
+
+def make_user(email: str) -> User:
+    return User(id=uuid.uuid4(), email=email, auth_provider="local")
+
+
+def test_hit_and_miss_counters():
+    cache = UserCache(max_size=10, ttl_seconds=60)
+    user = make_user("cached@example.com")
+    assert cache.get_by_email(user.email) is None
+    cache.put(user)
+
+    cached = cache.get_by_email(user.email)
+    assert cached is not user
+    assert cached.id == user.id
+    assert cache.get_by_id(user.id).email == user.email
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 1
+
+
+def test_lru_eviction():
+    cache = UserCache(max_size=2, ttl_seconds=60)
+    first, second, third = (make_user(f"user{i}@example.com") for i in range(3))
+    cache.put(first)
+    cache.put(second)
+    cache.get_by_email(first.email)  # `second` becomes least recently used
+    cache.put(third)
+
+    assert cache.get_by_email(second.email) is None
+    assert cache.get_by_email(first.email) is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_expiry():
+    cache = UserCache(max_size=10, ttl_seconds=60)
+    user = make_user("expiring@example.com")
+    with patch("app.core.security.user_cache.time.monotonic", return_value=0):
+        cache.put(user)
+    with patch("app.core.security.user_cache.time.monotonic", return_value=61):
+        assert cache.get_by_email(user.email) is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_invalidate_by_id_drops_email_entry():
+    cache = UserCache(max_size=10, ttl_seconds=60)
+    user = make_user("invalidate@example.com")
+    cache.put(user)
+    cache.invalidate(user_id=user.id)
+    assert cache.get_by_email(user.email) is None
+    assert cache.get_by_id(user.id) is None
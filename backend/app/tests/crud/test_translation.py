@@ -0,0 +1,107 @@
+import json
+from unittest.mock import MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from app.crud.crud_translation import (
+    NOTIFY_MAX_CHANGES,
+    TRANSLATION_CHANGES_CHANNEL,
+    create_translation,
+    get_translations_page,
+    notify_translation_changes,
+    upsert_translations,
+)
+from app.models.translation import Translation
+
+
+def _notified_payloads(db: MagicMock) -> list[dict]:
+    params = db.execute.call_args.args[1]
+    assert params["channel"] == TRANSLATION_CHANGES_CHANNEL
+    return [json.loads(payload) for payload in params["payloads"]]
+
+
+def test_create_translation_records_change_before_commit():
+    db = MagicMock()
+    calls = []
+    db.execute.side_effect = lambda *args, **kwargs: calls.append("execute")
+    db.commit.side_effect = lambda: calls.append("commit")
+
+    create_translation(db, Translation(language_code="en", key="hi", value="Hi"))
+
+    # Lock, history row and NOTIFY are part of the write transaction
+    assert calls == ["execute", "execute", "execute", "commit"]
+    lock = db.execute.call_args_list[0].args[0]
+    assert "pg_advisory_xact_lock" in str(lock)
+    assert _notified_payloads(db) == [
+        {"op": "set", "language_code": "en", "key": "hi", "value": "Hi"}
+    ]
+
+
+def test_notify_without_changes_does_nothing():
+    db = MagicMock()
+    notify_translation_changes(db, [])
+    db.execute.assert_not_called()
+
+
+def test_notify_many_changes_sends_reload_per_language():
+    db = MagicMock()
+    changes = [
+        {"op": "set", "language_code": code, "key": f"k{i}", "value": "v"}
+        for i in range(NOTIFY_MAX_CHANGES + 1)
+        for code in ("en", "cs")
+    ]
+    notify_translation_changes(db, changes)
+    assert _notified_payloads(db) == [
+        {"op": "reload", "language_code": "en"},
+        {"op": "reload", "language_code": "cs"},
+    ]
+
+
+def test_notify_changes_to_many_languages_sends_single_reload():
+    db = MagicMock()
+    changes = [
+        {"op": "set", "language_code": f"l{i}", "key": "k", "value": "v"}
+        for i in range(NOTIFY_MAX_CHANGES + 1)
+    ]
+    notify_translation_changes(db, changes)
+    assert _notified_payloads(db) == [{"op": "reload"}]
+
+
+def test_notify_oversized_payload_sends_reload():
+    db = MagicMock()
+    change = {"op": "set", "language_code": "en", "key": "k", "value": "😀" * 1000}
+    notify_translation_changes(db, [change])
+    assert _notified_payloads(db) == [{"op": "reload", "language_code": "en"}]
+
+
+def test_upsert_keeps_last_occurrence_of_repeated_pair():
+    db = MagicMock()
+    db.execute.return_value = []
+    upsert_translations(
+        db,
+        [
+            {"language_code": "en", "key": "hi", "value": "Hi"},
+            {"language_code": "en", "key": "bye", "value": "Bye"},
+            {"language_code": "en", "key": "hi", "value": "Hello"},
+        ],
+    )
+
+    # Postgres rejects an upsert that touches the same row twice
+    statement = db.execute.call_args_list[0].args[0]
+    params = statement.compile(dialect=postgresql.dialect()).params
+    values = sorted(v for name, v in params.items() if name.startswith("value"))
+    assert values == ["Bye", "Hello"]
+    db.commit.assert_called_once()
+
+
+def test_listing_escapes_like_wildcards_in_prefix_and_search():
+    db = MagicMock()
+    get_translations_page(db, "en", 11, after="a", prefix="50%_", search="x\\y")
+
+    statement = db.exec.call_args.args[0]
+    compiled = statement.compile(dialect=postgresql.dialect())
+    params = compiled.params
+    assert "50\\%\\_%" in params.values()
+    assert "%x\\\\y%" in params.values()
+    assert "a" in params.values()
+    assert "ORDER BY translation.key" in str(compiled)
@@ -4,17 +4,19 @@ from datetime import datetime, timedelta, timezone
 import pytest
 from pydantic import ValidationError
 
+from app.core.security.refresh_token_service import hash_refresh_token
+
 # Adjust the import path to match your project structure
 from app.models.token import RefreshToken
 
 
 def test_refresh_token_defaults():
     user_email = "user@example.com"
-    token = "sometoken"
+    token_hash = hash_refresh_token("sometoken")
     expires_at = datetime.now(timezone.utc) + timedelta(days=1)
 
     refresh_token = RefreshToken(
-        user_email=user_email, token=token, expires_at=expires_at
+        user_email=user_email, token_hash=token_hash, expires_at=expires_at
     )
 
     # Check that an id was automatically generated and is a valid UUID
@@ -22,7 +24,8 @@ def test_refresh_token_defaults():
 
     # Verify that the provided values are correctly set
     assert refresh_token.user_email == user_email
-    assert refresh_token.token == token
+    assert refresh_token.token_hash == token_hash
+    assert len(refresh_token.token_hash) == 64
     assert refresh_token.expires_at == expires_at
 
     # Verify that created_at is set to a datetime with timezone info,
@@ -33,25 +36,34 @@ def test_refresh_token_defaults():
     assert refresh_token.created_at.tzinfo is not None
 
 
-def test_refresh_token_missing_token():
+def test_refresh_token_missing_token_hash():
     user_email = "user@example.com"
     expires_at = datetime.now(timezone.utc) + timedelta(days=1)
 
-    # token is required, so missing it should raise a validation error
+    # token_hash is required, so missing it should raise a validation error
     with pytest.raises(ValidationError):
         RefreshToken.model_validate(
             {
                 "user_email": user_email,
-                "expires_at": expires_at,  # token missing
+                "expires_at": expires_at,  # token_hash missing
             }
         )
 
 
+def test_hash_refresh_token_is_stable_digest():
+    digest = hash_refresh_token("sometoken")
+    assert digest == hash_refresh_token("sometoken")
+    assert digest != hash_refresh_token("othertoken")
+    assert len(digest) == 64
+
+
 def test_refresh_token_missing_expires_at():
     user_email = "user@example.com"
-    token = "sometoken"
+    token_hash = hash_refresh_token("sometoken")
 
     # expires_at is required, so missing it should raise a validation error.
     with pytest.raises(ValidationError):
         # Use model_validate to enforce validation.
-        RefreshToken.model_validate({"user_email": user_email, "token": token})
+        RefreshToken.model_validate(
+            {"user_email": user_email, "token_hash": token_hash}
+        )
@@ -0,0 +1,13 @@
+import pytest
+from pydantic import ValidationError
+
+from app.models.translation import TranslationCreateSchema
+
+
+def test_translation_value_fits_the_column():
+    row = TranslationCreateSchema(language_code="en", key="hello", value="x" * 1000)
+    assert len(row.value) == 1000
+
+    # Longer values would make the whole bulk insert fail in the database
+    with pytest.raises(ValidationError):
+        TranslationCreateSchema(language_code="en", key="hello", value="x" * 1001)
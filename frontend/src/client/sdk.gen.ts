@@ -3,7 +3,7 @@
 import type { CancelablePromise } from './core/CancelablePromise';
 import { OpenAPI } from './core/OpenAPI';
 import { request as __request } from './core/request';
-import type { GetAllUsersData, GetAllUsersResponse, CreateUserData, CreateUserResponse, GetAdminUserDetailData, GetAdminUserDetailResponse, UpdateUserData, UpdateUserResponse, DeleteUserData, DeleteUserResponse, CustomModulesCreateProductData, CustomModulesCreateProductResponse, CustomModulesReadAllProductsData, CustomModulesReadAllProductsResponse, CustomModulesReadProductByIdData, CustomModulesReadProductByIdResponse, CustomModulesUpdateProductData, CustomModulesUpdateProductResponse, CustomModulesDeleteProductData, CustomModulesDeleteProductResponse, AuthenticationLoginUserData, AuthenticationLoginUserResponse, AuthenticationRefreshAccessTokenData, AuthenticationRefreshAccessTokenResponse, RegisterNewUserData, RegisterNewUserResponse, GetCurrentUserResponse, ChangePasswordData, ChangePasswordResponse, DeleteCurrentUserResponse, AuthenticationLogoutData, AuthenticationLogoutResponse, AuthenticationRecoverPasswordData, AuthenticationRecoverPasswordResponse, AuthenticationResetPasswordData, AuthenticationResetPasswordResponse, CustomModulesGetStatsResponse, CustomModulesGetAdminDashboardResponse, CustomModulesGetErrorsResponse, CustomModulesCreateProduct1Data, CustomModulesCreateProduct1Response, CustomModulesReadAllProducts1Data, CustomModulesReadAllProducts1Response, CustomModulesReadProductById1Data, CustomModulesReadProductById1Response, CustomModulesUpdateProduct1Data, CustomModulesUpdateProduct1Response, CustomModulesDeleteProduct1Data, CustomModulesDeleteProduct1Response, CreateTranslationData, CreateTranslationResponse, GetTranslationsData, GetTranslationsResponse, GetTranslationData, GetTranslationResponse, UpdateTranslationData, UpdateTranslationResponse, DeleteTranslationData, DeleteTranslationResponse, GetBulkTranslationsData, GetBulkTranslationsResponse, BulkInsertTranslationsData, BulkInsertTranslationsResponse, OauthLoginsGetOauthUrlsResponse, OauthLoginsGoogleLoginResponse, OauthLoginsGoogleAuthCallbackResponse, OauthLoginsFacebookLoginResponse, OauthLoginsFacebookAuthCallbackResponse, UpdateCurrentUserData, UpdateCurrentUserResponse, GetUserByIdData, GetUserByIdResponse, UtilitiesTestEmailData, UtilitiesTestEmailResponse, UtilitiesHealthCheckResponse } from './types.gen';
+import type { GetAllUsersData, GetAllUsersResponse, CreateUserData, CreateUserResponse, GetAdminUserDetailData, GetAdminUserDetailResponse, UpdateUserData, UpdateUserResponse, DeleteUserData, DeleteUserResponse, CustomModulesCreateProductData, CustomModulesCreateProductResponse, CustomModulesReadAllProductsData, CustomModulesReadAllProductsResponse, CustomModulesReadProductByIdData, CustomModulesReadProductByIdResponse, CustomModulesUpdateProductData, CustomModulesUpdateProductResponse, CustomModulesDeleteProductData, CustomModulesDeleteProductResponse, AuthenticationLoginUserData, AuthenticationLoginUserResponse, AuthenticationRefreshAccessTokenData, AuthenticationRefreshAccessTokenResponse, RegisterNewUserData, RegisterNewUserResponse, GetCurrentUserResponse, ChangePasswordData, ChangePasswordResponse, DeleteCurrentUserResponse, AuthenticationLogoutData, AuthenticationLogoutResponse, AuthenticationRecoverPasswordData, AuthenticationRecoverPasswordResponse, AuthenticationResetPasswordData, AuthenticationResetPasswordResponse, CustomModulesGetStatsResponse, CustomModulesGetAdminDashboardResponse, CustomModulesGetErrorsResponse, CustomModulesCreateProduct1Data, CustomModulesCreateProduct1Response, CustomModulesReadAllProducts1Data, CustomModulesReadAllProducts1Response, CustomModulesReadProductById1Data, CustomModulesReadProductById1Response, CustomModulesUpdateProduct1Data, CustomModulesUpdateProduct1Response, CustomModulesDeleteProduct1Data, CustomModulesDeleteProduct1Response, CreateTranslationData, CreateTranslationResponse, GetTranslationBundlesResponse, GetTranslationBundleData, GetTranslationBundleResponse, ListTranslationsData, ListTranslationsResponse, GetTranslationsData, GetTranslationsResponse, GetTranslationData, GetTranslationResponse, UpdateTranslationData, UpdateTranslationResponse, DeleteTranslationData, DeleteTranslationResponse, GetBulkTranslationsData, GetBulkTranslationsResponse, BulkInsertTranslationsData, BulkInsertTranslationsResponse, OauthLoginsGetOauthUrlsResponse, OauthLoginsGoogleLoginResponse, OauthLoginsGoogleAuthCallbackResponse, OauthLoginsFacebookLoginResponse, OauthLoginsFacebookAuthCallbackResponse, UpdateCurrentUserData, UpdateCurrentUserResponse, GetUserByIdData, GetUserByIdResponse, UtilitiesTestEmailData, UtilitiesTestEmailResponse, UtilitiesHealthCheckResponse } from './types.gen';
 
 export class AdminService {
     /**
@@ -677,6 +677,78 @@ export class LanguagesService {
         });
     }
     
+    /**
+     * Get Translation Bundles Route
+     * List the current bundle of every language with its content-hashed URL.
+     * Languages this worker has not loaded are listed with their plain URL.
+     * @returns TranslationBundleInfo Successful Response
+     * @throws ApiError
+     */
+    public static getTranslationBundles(): CancelablePromise<GetTranslationBundlesResponse> {
+        return __request(OpenAPI, {
+            method: 'GET',
+            url: '/api/v1/lang/bundles/'
+        });
+    }
+    
+    /**
+     * Get Translation Bundle Route
+     * Retrieve all translations of a language as a key -> value object.
+     * Served from memory with a strong ETag; send If-None-Match to get a 304.
+     * @param data The data for the request.
+     * @param data.languageCode
+     * @returns string Successful Response
+     * @throws ApiError
+     */
+    public static getTranslationBundle(data: GetTranslationBundleData): CancelablePromise<GetTranslationBundleResponse> {
+        return __request(OpenAPI, {
+            method: 'GET',
+            url: '/api/v1/lang/bundles/{language_code}',
+            path: {
+                language_code: data.languageCode
+            },
+            errors: {
+                422: 'Validation Error'
+            }
+        });
+    }
+    
+    /**
+     * List Translations Route
+     * Retrieve one page of a language's translations ordered by key.
+     * Pass `next_cursor` as `after` to get the next page. `prefix` filters keys,
+     * `search` matches a substring of the key or value (case-insensitive).
+     * `include_total` adds a planner estimate of the matching rows.
+     * @param data The data for the request.
+     * @param data.languageCode
+     * @param data.limit
+     * @param data.after
+     * @param data.prefix
+     * @param data.search
+     * @param data.includeTotal
+     * @returns TranslationsPublic Successful Response
+     * @throws ApiError
+     */
+    public static listTranslations(data: ListTranslationsData): CancelablePromise<ListTranslationsResponse> {
+        return __request(OpenAPI, {
+            method: 'GET',
+            url: '/api/v1/lang/listing/{language_code}',
+            path: {
+                language_code: data.languageCode
+            },
+            query: {
+                limit: data.limit,
+                after: data.after,
+                prefix: data.prefix,
+                search: data.search,
+                include_total: data.includeTotal
+            },
+            errors: {
+                422: 'Validation Error'
+            }
+        });
+    }
+    
     /**
      * Get Translations Route
      * Retrieve all translations for the specified language.
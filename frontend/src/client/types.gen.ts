@@ -54,6 +54,12 @@ export type TokenRefreshRequest = {
     refresh_token: string;
 };
 
+export type TranslationBundleInfo = {
+    language_code: string;
+    content_hash?: (string | null);
+    url: string;
+};
+
 export type TranslationCreate = {
     language_code: string;
     key: string;
@@ -87,6 +93,12 @@ export type TranslationResponse = {
     translation: TranslationPublic;
 };
 
+export type TranslationsPublic = {
+    data: Array<TranslationPublic>;
+    next_cursor?: (string | null);
+    estimated_total?: (number | null);
+};
+
 export type TranslationUpdate = {
     language_code?: (string | null);
     key?: (string | null);
@@ -144,6 +156,18 @@ export type UserUpdateMe = {
     preferred_language?: (string | null);
 };
 
+export type UserUpdateMePublic = {
+    email: string;
+    is_active?: boolean;
+    is_superuser?: boolean;
+    full_name?: (string | null);
+    preferred_language: string;
+    id: string;
+    auth_provider: string;
+    avatar_url?: (string | null);
+    access_token?: (string | null);
+};
+
 export type ValidationError = {
     loc: Array<(string | number)>;
     msg: string;
@@ -304,6 +328,27 @@ export type CreateTranslationData = {
 
 export type CreateTranslationResponse = (TranslationResponse);
 
+export type GetTranslationBundlesResponse = (Array<TranslationBundleInfo>);
+
+export type GetTranslationBundleData = {
+    languageCode: string;
+};
+
+export type GetTranslationBundleResponse = ({
+    [key: string]: (string);
+});
+
+export type ListTranslationsData = {
+    after?: (string | null);
+    includeTotal?: boolean;
+    languageCode: string;
+    limit?: number;
+    prefix?: (string | null);
+    search?: (string | null);
+};
+
+export type ListTranslationsResponse = (TranslationsPublic);
+
 export type GetTranslationsData = {
     languageCode: string;
 };
@@ -362,7 +407,7 @@ export type UpdateCurrentUserData = {
     requestBody: UserUpdateMe;
 };
 
-export type UpdateCurrentUserResponse = (UserPublic);
+export type UpdateCurrentUserResponse = (UserUpdateMePublic);
 
 export type GetUserByIdData = {
     userId: string;
@@ -24,6 +24,7 @@ import {
     ModalCloseButton,
     ModalBody,
     ModalFooter,
+    Select,
 } from "@chakra-ui/react";
 import {useMutation, useQuery, useQueryClient} from "@tanstack/react-query";
 import {useState} from "react";
@@ -32,7 +33,15 @@ import {useTranslationHelper} from "../../utils/translationHelper";
 import {LanguagesService} from "../../client";
 import useAuth from "../../hooks/useAuth";
 // Import generated types from your OpenAPI SDK
-import type {TranslationCreate, TranslationPublic, TranslationUpdate} from "../../client";
+import type {
+    TranslationCreate,
+    TranslationPublic,
+    TranslationsPublic,
+    TranslationUpdate,
+} from "../../client";
+
+const defaultLanguage = "en";
+const itemsPerPage = 10;
 
 function AdminTranslations() {
     // Unconditionally call all hooks.
@@ -41,11 +50,37 @@ function AdminTranslations() {
     const {user} = useAuth();
     const {getTranslation, isTranslationsLoading} = useTranslationHelper();
 
-    const {data: translationsBulk, isLoading} = useQuery({
-        queryKey: ["translations", "bulk"],
+    const [language, setLanguage] = useState(defaultLanguage);
+    const [filter, setFilter] = useState("");
+    // cursors[i] is the `after` key of page i; the first page starts at null
+    const [cursors, setCursors] = useState<(string | null)[]>([null]);
+    const currentPage = cursors.length;
+
+    // Every language the server knows, whether or not its bundle is loaded
+    const {data: bundles} = useQuery({
+        queryKey: ["translations", "bundles"],
+        queryFn: async () => LanguagesService.getTranslationBundles(),
+    });
+    const languages = bundles?.length
+        ? bundles.map((bundle) => bundle.language_code)
+        : [defaultLanguage];
+
+    const listingKey = ["translations", "listing", language, filter];
+    const {data: translationsPage, isLoading} = useQuery({
+        queryKey: [...listingKey, cursors[currentPage - 1]],
         queryFn: async () =>
-            LanguagesService.getBulkTranslations({languages: ["en", "cs"]}),
+            LanguagesService.listTranslations({
+                languageCode: language,
+                limit: itemsPerPage,
+                after: cursors[currentPage - 1],
+                search: filter || null,
+                // The estimate costs a planner round trip; later pages reuse it
+                includeTotal: currentPage === 1,
+            }),
+        placeholderData: (previousData) => previousData,
     });
+    const estimatedTotal = queryClient.getQueryData<TranslationsPublic>([...listingKey, null])
+        ?.estimated_total;
 
     const {
         register: registerNew,
@@ -64,9 +99,6 @@ function AdminTranslations() {
     const {isOpen: isEditOpen, onOpen: onEditOpen, onClose: onEditClose} = useDisclosure();
     const {isOpen: isDeleteOpen, onOpen: onDeleteOpen, onClose: onDeleteClose} = useDisclosure();
 
-    const [filter, setFilter] = useState("");
-    const [currentPage, setCurrentPage] = useState(1);
-    const itemsPerPage = 10;
     const [selectedEditTranslation, setSelectedEditTranslation] = useState<TranslationPublic | null>(null);
     const [selectedDeleteTranslation, setSelectedDeleteTranslation] = useState<TranslationPublic | null>(null);
 
@@ -81,7 +113,7 @@ function AdminTranslations() {
                 duration: 3000,
                 isClosable: true,
             });
-            queryClient.invalidateQueries({queryKey: ["translations", "bulk"]});
+            queryClient.invalidateQueries({queryKey: ["translations", "listing"]});
             resetNewForm();
         },
         onError: (error: any) => {
@@ -106,7 +138,7 @@ function AdminTranslations() {
                 duration: 3000,
                 isClosable: true,
             });
-            queryClient.invalidateQueries({queryKey: ["translations", "bulk"]});
+            queryClient.invalidateQueries({queryKey: ["translations", "listing"]});
             onEditClose();
             setSelectedEditTranslation(null);
             resetEditForm();
@@ -135,7 +167,7 @@ function AdminTranslations() {
                 duration: 3000,
                 isClosable: true,
             });
-            queryClient.invalidateQueries({queryKey: ["translations", "bulk"]});
+            queryClient.invalidateQueries({queryKey: ["translations", "listing"]});
             onDeleteClose();
             setSelectedDeleteTranslation(null);
         },
@@ -161,34 +193,12 @@ function AdminTranslations() {
         return <p>{getTranslation("loading_translations")}</p>;
     }
 
-    const bulkTranslationsData = translationsBulk || {};
-
-    // Flatten translations from the bulk endpoint.
-    const allTranslations: { language_code: string; id: string; value: string; key: string }[] =
-        Object.entries(bulkTranslationsData).flatMap(([lang, transObj]) =>
-            Object.entries(transObj as Record<string, string>).map(([key, value]) => ({
-                language_code: lang,
-                key,
-                value,
-                id: `${lang}-${key}`, // Note: this composite id may not be valid for deletion!
-            }))
-        );
-
-    const filteredTranslations = allTranslations.filter((item) => {
-        const lang = item.language_code || "";
-        const key = item.key || "";
-        const value = item.value || "";
-        return (
-            lang.toLowerCase().includes(filter.toLowerCase()) ||
-            key.toLowerCase().includes(filter.toLowerCase()) ||
-            value.toLowerCase().includes(filter.toLowerCase())
-        );
-    });
-
-    const totalPages = Math.ceil(filteredTranslations.length / itemsPerPage);
-    const paginatedTranslations = filteredTranslations.slice(
-        (currentPage - 1) * itemsPerPage,
-        currentPage * itemsPerPage
+    // Pages come from the server one at a time, filtered and ordered by key.
+    const paginatedTranslations = translationsPage?.data ?? [];
+    const nextCursor = translationsPage?.next_cursor ?? null;
+    const totalPages = Math.max(
+        Math.ceil((estimatedTotal ?? 0) / itemsPerPage),
+        currentPage,
     );
 
     const renderRows = () =>
@@ -274,14 +284,28 @@ function AdminTranslations() {
                 <Button type="submit">{getTranslation("translation_create_button")}</Button>
             </Box>
 
-            {/* Filter Input */}
-            <Box mb={4}>
+            {/* Language and Filter Inputs */}
+            <Box mb={4} display="flex" gap={2}>
+                <Select
+                    maxW="8rem"
+                    value={language}
+                    onChange={(e) => {
+                        setLanguage(e.target.value);
+                        setCursors([null]);
+                    }}
+                >
+                    {languages.map((code) => (
+                        <option key={code} value={code}>
+                            {code}
+                        </option>
+                    ))}
+                </Select>
                 <Input
                     placeholder={getTranslation("translation_filter_placeholder")}
                     value={filter}
                     onChange={(e) => {
                         setFilter(e.target.value);
-                        setCurrentPage(1);
+                        setCursors([null]);
                     }}
                 />
             </Box>
@@ -305,18 +329,18 @@ function AdminTranslations() {
             <Box mt={4} display="flex" justifyContent="center" alignItems="center">
                 <Button
                     mr={2}
-                    onClick={() => setCurrentPage((prev) => Math.max(prev - 1, 1))}
+                    onClick={() => setCursors((prev) => (prev.length > 1 ? prev.slice(0, -1) : prev))}
                     disabled={currentPage === 1}
                 >
                     {getTranslation("pagination_previous")}
                 </Button>
                 <Text>
-                    {currentPage} / {totalPages || 1}
+                    {currentPage} / ~{totalPages}
                 </Text>
                 <Button
                     ml={2}
-                    onClick={() => setCurrentPage((prev) => Math.min(prev + 1, totalPages))}
-                    disabled={currentPage === totalPages || totalPages === 0}
+                    onClick={() => nextCursor && setCursors((prev) => [...prev, nextCursor])}
+                    disabled={!nextCursor}
                 >
                     {getTranslation("pagination_next")}
                 </Button>
@@ -74,7 +74,11 @@ const UserInformation = () => {
     const mutation = useMutation({
         mutationFn: (data: UserUpdateMeExtended) =>
             UsersService.updateCurrentUser({requestBody: data}),
-        onSuccess: () => {
+        onSuccess: (updatedUser) => {
+            // A new access token is returned when its claims (email, language) changed.
+            if (updatedUser.access_token) {
+                localStorage.setItem("access_token", updatedUser.access_token);
+            }
             // Update localStorage with the new preferred language if needed.
             const newLang = getValues("preferred_language");
             // Optionally, you can update your auth context here
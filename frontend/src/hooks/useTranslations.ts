@@ -1,25 +1,12 @@
 import {useQuery} from "@tanstack/react-query";
 import {LanguagesService} from "../client";
 
-// Optional: define the shape of each translation record from the server
-type TranslationItem = {
-    key: string;
-    value: string;
-};
-
 const useTranslations = (language: string) => {
     return useQuery<Record<string, string>, Error>({
         queryKey: ["translations", language],
-        queryFn: async () => {
-            const response: TranslationItem[] = await LanguagesService.getTranslations({
-                languageCode: language,
-            });
-            // Convert [{ key, value }, ...] => { [key]: value, ... }
-            return response.reduce((acc, {key, value}) => {
-                acc[key] = value;
-                return acc;
-            }, {} as Record<string, string>);
-        },
+        // The bundle is already a { [key]: value } object; the browser revalidates
+        // it with its ETag, so unchanged catalogs come back as a bodiless 304.
+        queryFn: () => LanguagesService.getTranslationBundle({languageCode: language}),
         // Remove cacheTime if it causes TS errors
         // cacheTime: Infinity,
         staleTime: Infinity,